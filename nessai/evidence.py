@@ -4,15 +4,23 @@ Functions related to computing the evidence.
 """
 from abc import ABC, abstractmethod
 import logging
+import math
 
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.special import logsumexp
 
 from .plot import nessai_style
+from .utils.stats import effective_sample_size
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+    logger.debug("Could not import numba, integral state will not use JIT")
+
 
 def logsubexp(x, y):
     """
@@ -56,6 +64,75 @@ def log_integrate_log_trap(log_func, log_support):
     return logsumexp(log_func_sum + log_dxs)
 
 
+def _log1pexp(x):
+    """Compute :code:`log(1 + exp(x))` for a scalar without using NumPy.
+
+    Parameters
+    ----------
+    x : float
+        Input value.
+
+    Returns
+    -------
+    float
+        Value of :code:`log(1 + exp(x))`.
+    """
+    if x < 0:
+        return math.log1p(math.exp(x))
+    return x + math.log1p(math.exp(-x))
+
+
+def _increment_kernel(logL, logw, logZ, info, logt, log_shrink):
+    """Scalar update of the nested sampling integral.
+
+    Only uses scalar operations so that it can be compiled with numba if it
+    is installed.
+
+    Parameters
+    ----------
+    logL : float
+        New log-likelihood.
+    logw : float
+        Current log prior volume.
+    logZ : float
+        Current log-evidence.
+    info : float
+        Current estimate of the information.
+    logt : float
+        Expected log-shrinkage of the prior volume.
+    log_shrink : float
+        Log of the fraction of prior volume removed, :code:`log(1 - t)`.
+
+    Returns
+    -------
+    logZ_new : float
+        Updated log-evidence.
+    logw_new : float
+        Updated log prior volume.
+    info_new : float
+        Updated information, NaN if it cannot be computed.
+    """
+    wt = logw + logL + log_shrink
+    # Scalar logaddexp
+    if logZ == wt:
+        logZ_new = logZ + math.log(2.0)
+    else:
+        logZ_new = max(logZ, wt) + math.log1p(math.exp(-abs(logZ - wt)))
+    if math.isfinite(logZ) and math.isfinite(logZ_new) and math.isfinite(logL):
+        info_new = (
+            math.exp(wt - logZ_new) * logL
+            + math.exp(logZ - logZ_new) * (info + logZ)
+            - logZ_new
+        )
+    else:
+        info_new = math.nan
+    return logZ_new, logw + logt, info_new
+
+
+if njit is not None:
+    _increment_kernel = njit(cache=True)(_increment_kernel)
+
+
 class _BaseNSIntegralState(ABC):
     """Base class for the nested sampling integral."""
 
@@ -90,9 +167,7 @@ class _BaseNSIntegralState(ABC):
         log_p = self.log_posterior_weights
         if not len(log_p):
             return 0
-        log_p -= logsumexp(log_p)
-        n = np.exp(-logsumexp(2 * log_p))
-        return n
+        return effective_sample_size(log_p)
 
 
 class _NSIntegralState(_BaseNSIntegralState):
@@ -104,8 +179,8 @@ class _NSIntegralState(_BaseNSIntegralState):
     nlive : int
         Number of live points
     track_gradients : bool, optional
-        If true the gradient of the change in logL w.r.t logX is saved each
-        time `increment` is called.
+        If true the gradient of the change in logL w.r.t logX is available
+        via :code:`gradients`. It is computed from the history when accessed.
     expectation : str, {logt, t}
         Method used to compute the expectation value for the shrinkage t.
         Choose between log <t> or <log t>. Defaults to <log t>.
@@ -120,17 +195,91 @@ class _NSIntegralState(_BaseNSIntegralState):
                 f"Expectation must be t or logt, got: {expectation}"
             )
         self.expectation = expectation.lower()
+        # Shrinkage for the default number of live points is constant, so it
+        # is computed once and stored as Python floats for the scalar kernel
+        logt, log_shrink = self._shrinkage(nlive)
+        self._logt = float(logt)
+        self._log_shrink = float(log_shrink)
 
         # Initial state of the integral
         self.logZ = -np.inf
         self.oldZ = -np.inf
         self.logw = 0
-        self.info = [0.0]
+        # History is stored in preallocated arrays that grow geometrically,
+        # the number of valid entries in each is tracked separately.
+        self._capacity = max(16 * nlive, 1024)
+        self._logLs = np.empty(self._capacity)
+        self._log_vols = np.empty(self._capacity)
+        self._info = np.empty(self._capacity)
+        self._nlive = np.empty(self._capacity, dtype=int)
         # Initially contain all the prior volume
-        self.logLs = [-np.inf]  # Likelihoods sampled
-        self.log_vols = [0.0]  # Volumes enclosed by contours
-        self.nlive = []
-        self.gradients = [0]
+        self._logLs[0] = -np.inf  # Likelihoods sampled
+        self._log_vols[0] = 0.0  # Volumes enclosed by contours
+        self._info[0] = 0.0
+        self._n = 1
+        self._n_info = 1
+
+    @property
+    def logLs(self):
+        """Log-likelihoods sampled, including the initial point."""
+        return self._logLs[: self._n]
+
+    @property
+    def log_vols(self):
+        """Log prior volumes enclosed by each contour."""
+        return self._log_vols[: self._n]
+
+    @property
+    def info(self):
+        """Estimates of the information at each iteration."""
+        return self._info[: self._n_info]
+
+    @property
+    def gradients(self):
+        """Gradient of the log-likelihood w.r.t. the log prior volume.
+
+        Computed from the history each time it is accessed, the first value
+        is always zero. If :code:`track_gradients` is false, only the first
+        value is returned.
+        """
+        if not self.track_gradients:
+            return np.zeros(1)
+        return np.concatenate(
+            [[0.0], np.diff(self.logLs) / np.diff(self.log_vols)]
+        )
+
+    @property
+    def nlive(self):
+        """Number of live points used for each increment."""
+        return self._nlive[: self._n - 1]
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "_logLs" in state:
+            return
+        # States pickled before the history was stored in preallocated arrays
+        # contain lists, convert them so old resume files can be loaded.
+        logLs = self.__dict__.pop("logLs")
+        log_vols = self.__dict__.pop("log_vols")
+        info = self.__dict__.pop("info")
+        nlive = self.__dict__.pop("nlive")
+        self.__dict__.pop("gradients", None)
+        logt, log_shrink = self._shrinkage(self.base_nlive)
+        self._logt = float(logt)
+        self._log_shrink = float(log_shrink)
+        self._capacity = max(16 * self.base_nlive, 1024)
+        while self._capacity <= len(logLs):
+            self._capacity *= 2
+        self._logLs = np.empty(self._capacity)
+        self._log_vols = np.empty(self._capacity)
+        self._info = np.empty(self._capacity)
+        self._nlive = np.empty(self._capacity, dtype=int)
+        self._n = len(logLs)
+        self._n_info = len(info)
+        self._logLs[: self._n] = logLs
+        self._log_vols[: self._n] = log_vols
+        self._info[: self._n_info] = info
+        self._nlive[: len(nlive)] = nlive
 
     @property
     def log_evidence(self):
@@ -142,47 +291,153 @@ class _NSIntegralState(_BaseNSIntegralState):
         """The current error on the log-evidence."""
         return np.sqrt(self.info[-1] / self.base_nlive)
 
+    def _shrinkage(self, nlive):
+        """Compute the expected log-shrinkage and log(1 - t).
+
+        Parameters
+        ----------
+        nlive : int or numpy.ndarray
+            Number of live points.
+
+        Returns
+        -------
+        logt : float or numpy.ndarray
+            Expected log-shrinkage.
+        log_shrink : float or numpy.ndarray
+            Log of the fraction of prior volume removed.
+        """
+        if self.expectation == "logt":
+            # <logt> approx -1 / N
+            logt = -1.0 / nlive
+        else:
+            # <t> = N / (N + 1)
+            logt = -np.log1p(1 / nlive)
+        return logt, np.log1p(-np.exp(logt))
+
+    def _grow(self):
+        """Double the capacity of the arrays used to store the history."""
+        self._capacity *= 2
+        for name in ["_logLs", "_log_vols", "_info", "_nlive"]:
+            setattr(self, name, np.resize(getattr(self, name), self._capacity))
+
+    def _closed_history(self):
+        """Get the log-likelihoods and log prior volumes including the final
+        point at X=0.
+
+        The extra point is written to the end of the preallocated arrays so
+        no copy is made.
+
+        Returns
+        -------
+        log_L : numpy.ndarray
+            Log-likelihood values with the final value repeated.
+        log_vols : numpy.ndarray
+            Log prior volumes ending with -inf.
+        """
+        n = self._n
+        if n == self._capacity:
+            self._grow()
+        self._logLs[n] = self._logLs[n - 1]
+        self._log_vols[n] = np.NINF
+        return self._logLs[: n + 1], self._log_vols[: n + 1]
+
     def increment(self, logL, nlive=None):
         """
         Increment the state of the evidence integrator
         Simply uses rectangle rule for initial estimate
         """
-        if logL <= self.logLs[-1]:
+        n = self._n
+        if n == self._capacity:
+            self._grow()
+        logL_prev = self._logLs[n - 1]
+        if logL <= logL_prev:
             logger.warning(
                 "NS integrator received non-monotonic logL."
-                f"{self.logLs[-1]:.5f} -> {logL:.5f}"
+                f"{logL_prev:.5f} -> {logL:.5f}"
             )
-        if nlive is None:
+        if nlive is None or nlive == self.base_nlive:
             nlive = self.base_nlive
-
-        self.nlive.append(nlive)
-        oldZ = self.logZ
-        if self.expectation == "logt":
-            # <logt> approx -1 / N
-            logt = -1.0 / nlive
+            logt, log_shrink = self._logt, self._log_shrink
         else:
-            # <t> = N / (N + 1)
-            logt = -np.log1p(1 / nlive)
-        Wt = self.logw + logL + np.log1p(-np.exp(logt))
-        self.logZ = np.logaddexp(self.logZ, Wt)
+            logt, log_shrink = map(float, self._shrinkage(nlive))
+
+        self._nlive[n - 1] = nlive
+        logZ, logw, info = _increment_kernel(
+            float(logL),
+            float(self.logw),
+            float(self.logZ),
+            float(self._info[self._n_info - 1]),
+            logt,
+            log_shrink,
+        )
+        self.logZ = logZ
+        self.logw = logw
         # Update information estimate
-        if np.isfinite(oldZ) and np.isfinite(self.logZ) and np.isfinite(logL):
-            info = (
-                np.exp(Wt - self.logZ) * logL
-                + np.exp(oldZ - self.logZ) * (self.info[-1] + oldZ)
-                - self.logZ
-            )
-            self.info.append(info)
+        if not math.isnan(info):
+            self._info[self._n_info] = info
+            self._n_info += 1
 
         # Update history
-        self.logw += logt
-        self.logLs.append(logL)
-        self.log_vols.append(self.logw)
-        if self.track_gradients:
-            self.gradients.append(
-                (self.logLs[-1] - self.logLs[-2])
-                / (self.log_vols[-1] - self.log_vols[-2])
-            )
+        self._logLs[n] = logL
+        self._log_vols[n] = logw
+        self._n = n + 1
+
+    def increment_batch(self, logL, nlive):
+        """Increment the state of the evidence integrator with several
+        log-likelihood values at once.
+
+        Equivalent to calling :py:meth:`increment` for each value but
+        vectorised. Used when removing the final live points, where the
+        number of live points decreases at each step.
+
+        Parameters
+        ----------
+        logL : array_like
+            Sorted log-likelihood values.
+        nlive : array_like
+            Number of live points for each value.
+        """
+        logL = np.asarray(logL, dtype=float)
+        nlive = np.asarray(nlive)
+        m = logL.size
+        if not m:
+            return
+        if not (np.isfinite(self.logZ) and np.isfinite(logL).all()):
+            # Information is only updated for finite values, fall back to
+            # the sequential version to handle these cases.
+            for v, n_i in zip(logL, nlive):
+                self.increment(v, nlive=n_i)
+            return
+
+        n = self._n
+        while n + m >= self._capacity:
+            self._grow()
+        logL_prev = np.concatenate([[self._logLs[n - 1]], logL[:-1]])
+        if np.any(logL <= logL_prev):
+            logger.warning("NS integrator received non-monotonic logL.")
+
+        logt, log_shrink = self._shrinkage(nlive)
+        # Accumulate from the current volume so the values match the
+        # sequential additions in increment exactly
+        log_vols = np.cumsum(np.concatenate([[self.logw], logt]))[1:]
+        Wt = log_vols - logt + logL + log_shrink
+        logZ = np.logaddexp.accumulate(np.concatenate([[self.logZ], Wt]))[1:]
+        # exp(Z_k) * (H_k + Z_k) is a cumulative sum, compute it relative to
+        # the final evidence to avoid overflow.
+        logZ_final = logZ[-1]
+        c = np.exp(self.logZ - logZ_final) * (
+            self._info[self._n_info - 1] + self.logZ
+        ) + np.cumsum(np.exp(Wt - logZ_final) * logL)
+        info = c * np.exp(logZ_final - logZ) - logZ
+
+        self._nlive[n - 1 : n - 1 + m] = nlive
+        self._logLs[n : n + m] = logL
+        self._log_vols[n : n + m] = log_vols
+        self._info[self._n_info : self._n_info + m] = info
+        self._n_info += m
+        self._n = n + m
+        self.logw = log_vols[-1]
+        self.logZ = logZ_final
 
     def finalise(self):
         """
@@ -191,10 +446,7 @@ class _NSIntegralState(_BaseNSIntegralState):
         """
         # Trapezoidal rule
         # Extra point represents X=0 and assume max(L) = L[-1]
-        self.logZ = log_integrate_log_trap(
-            np.array(self.logLs + [self.logLs[-1]]),
-            np.array(self.log_vols + [np.NINF]),
-        )
+        self.logZ = log_integrate_log_trap(*self._closed_history())
         return self.logZ
 
     @nessai_style()
@@ -229,8 +481,7 @@ class _NSIntegralState(_BaseNSIntegralState):
     @property
     def log_posterior_weights(self):
         """Compute the log-posterior weights."""
-        log_L = np.array(self.logLs + [self.logLs[-1]])
-        log_vols = np.array(self.log_vols + [np.NINF])
+        log_L, log_vols = self._closed_history()
         log_Z = log_integrate_log_trap(log_L, log_vols)
         log_w = logsubexp(log_vols[:-1], log_vols[1:])
         log_post_w = log_L[1:-1] + log_w[:-1] - log_Z
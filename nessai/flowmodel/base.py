@@ -16,6 +16,7 @@ from ..flows import configure_model, reset_weights, reset_permutations
 from ..flows.base import BaseFlow
 from ..plot import plot_loss
 from ..utils import save_to_json, compute_minimum_distances
+from ..utils.torchutils import load_state_dict
 
 logger = logging.getLogger(__name__)
 
@@ -657,7 +658,7 @@ class FlowModel:
         # TODO: these two methods are basically the same
         if not self.initialised:
             self.initialise()
-        self.model.load_state_dict(torch.load(weights_file))
+        self.model.load_state_dict(load_state_dict(weights_file))
         self.model.eval()
         self.weights_file = weights_file
 
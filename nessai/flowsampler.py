@@ -54,7 +54,9 @@ class FlowSampler:
     likelihood_chunksize : Optional[int]
         Chunksize used when evaluating a vectorised likelihood. Overrides the
         of :py:attr:`nessai.model.Model.likelihood_chunksize`. Set to None to
-        evaluate the likelihood with all available points.
+        evaluate the likelihood with all available points. Also sets the
+        number of points sent to each process when using a pool with a
+        likelihood that is not vectorised.
     allow_multi_valued_likelihood : Optional[bool]
         Allow for a multi-valued likelihood function that will return different
         likelihood values for the same point in parameter space. See
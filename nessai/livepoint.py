@@ -3,6 +3,7 @@
 Functions related to creating live points and converting to other common
 data-types.
 """
+from functools import lru_cache
 import logging
 
 import numpy as np
@@ -90,14 +91,23 @@ def get_dtype(names, array_dtype=None, non_sampling_parameters=True):
     """
     if array_dtype is None:
         array_dtype = config.livepoints.default_float_dtype
-    dtype = [(n, array_dtype) for n in names]
     if non_sampling_parameters:
-        dtype += list(
-            zip(
-                config.livepoints.non_sampling_parameters,
-                config.livepoints.non_sampling_dtype,
-            )
-        )
+        extra_names = tuple(config.livepoints.non_sampling_parameters)
+        extra_dtype = tuple(config.livepoints.non_sampling_dtype)
+    else:
+        extra_names, extra_dtype = (), ()
+    return _get_dtype(tuple(names), array_dtype, extra_names, extra_dtype)
+
+
+@lru_cache(maxsize=128)
+def _get_dtype(names, array_dtype, extra_names, extra_dtype):
+    """Construct the dtype for the structured array.
+
+    Results are cached since the same dtype is constructed repeatedly when
+    converting small batches of points. All of the inputs must be hashable.
+    """
+    dtype = [(n, array_dtype) for n in names]
+    dtype += list(zip(extra_names, extra_dtype))
     return np.dtype(dtype)
 
 
@@ -154,6 +164,35 @@ def empty_structured_array(
     return struct_array
 
 
+def copy_structured_array(x, out=None):
+    """Copy a structured array with a single copy of the underlying bytes.
+
+    :code:`numpy.ndarray.copy` copies structured arrays field by field, which
+    is several times slower than copying the raw memory when the array is
+    contiguous. Non-contiguous arrays fall back to the standard copy.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Structured array to copy.
+    out : Optional[numpy.ndarray]
+        Contiguous array with the same dtype and size as :code:`x` to copy
+        into. If not specified, a new array is allocated.
+
+    Returns
+    -------
+    numpy.ndarray
+        Copy of the structured array.
+    """
+    if out is None:
+        out = np.empty_like(x)
+    if x.flags.c_contiguous and out.flags.c_contiguous:
+        out.view(np.uint8)[...] = x.view(np.uint8)
+    else:
+        out[...] = x
+    return out
+
+
 def live_points_to_array(live_points, names=None):
     """
     Converts live points to unstructured arrays for training.
@@ -241,14 +280,21 @@ def numpy_array_to_live_points(array, names, non_sampling_parameters=True):
             0, names=names, non_sampling_parameters=non_sampling_parameters
         )
     if array.ndim == 1:
-        array = array[np.newaxis, :]
+        return parameters_to_live_point(
+            array[: len(names)],
+            names,
+            non_sampling_parameters=non_sampling_parameters,
+        )
     struct_array = empty_structured_array(
         len(array),
         names=names,
         non_sampling_parameters=non_sampling_parameters,
     )
-    for i, n in enumerate(names):
-        struct_array[n] = array[..., i]
+    # The parameters are adjacent in the structured array, so they can all be
+    # set with a single copy into an unstructured view. Any columns beyond
+    # the number of names are ignored.
+    view = unstructured_view(struct_array, names=names)
+    view[...] = array[:, : len(names)].reshape(view.shape)
     return struct_array
 
 
@@ -299,7 +345,7 @@ def dict_to_live_points(d, non_sampling_parameters=True):
         return array
 
 
-def live_points_to_dict(live_points, names=None):
+def live_points_to_dict(live_points, names=None, copy=False):
     """
     Convert a structured array of live points to a dictionary with
     a key per field.
@@ -311,6 +357,9 @@ def live_points_to_dict(live_points, names=None):
     names : list of str or None
         If None all fields in the structured array are added to the dictionary
         else only those included in the list are added.
+    copy : bool
+        If True, each field is copied to a contiguous array. Otherwise, the
+        values are strided views of the structured array.
 
     Returns
     -------
@@ -319,6 +368,8 @@ def live_points_to_dict(live_points, names=None):
     """
     if names is None:
         names = live_points.dtype.names
+    if copy:
+        return {f: np.ascontiguousarray(live_points[f]) for f in names}
     return {f: live_points[f] for f in names}
 
 
@@ -327,9 +378,6 @@ def dataframe_to_live_points(df, non_sampling_parameters=True):
 
     Adds the non-sampling parameter initialised to their defaults.
 
-    Based on this answer on Stack Exchange:
-    https://stackoverflow.com/a/51280608
-
     Parameters
     ----------
     df : :obj:`pandas.DataFrame`
@@ -343,16 +391,12 @@ def dataframe_to_live_points(df, non_sampling_parameters=True):
         Numpy structured array with fields given by column names plus logP and
         logL.
     """
-    if non_sampling_parameters:
-        extra = config.livepoints.non_sampling_defaults
-    else:
-        extra = tuple()
-    return np.array(
-        [tuple(x) + extra for x in df.values],
-        dtype=get_dtype(
-            list(df.dtypes.index),
-            non_sampling_parameters=non_sampling_parameters,
-        ),
+    # For data frames with a single float block this is a view of the data
+    array = df.to_numpy(dtype=config.livepoints.default_float_dtype)
+    return numpy_array_to_live_points(
+        array,
+        list(df.dtypes.index),
+        non_sampling_parameters=non_sampling_parameters,
     )
 
 
@@ -398,6 +442,8 @@ def unstructured_view(x, names=None, dtype=None):
     """
     if dtype is None:
         dtype = _unstructured_view_dtype(x, names)
-    return np.ndarray(x.shape, dtype, x, 0, x.strides).view(
-        (config.livepoints.default_float_dtype, len(dtype))
-    )
+    view = np.ndarray(x.shape, dtype, x, 0, x.strides)
+    if len(dtype) == 1:
+        # Passing (type, 1) to view is deprecated in numpy
+        return view.view(config.livepoints.default_float_dtype)
+    return view.view((config.livepoints.default_float_dtype, len(dtype)))
@@ -16,6 +16,7 @@ from .livepoint import (
     _unstructured_view_dtype,
 )
 from .utils.multiprocessing import (
+    batch_log_likelihood_wrapper,
     get_n_pool,
     log_likelihood_wrapper,
 )
@@ -80,6 +81,8 @@ class Model(ABC):
     int
         Chunksize to use with a vectorised likelihood. If specified the
         likelihood will be called with at most chunksize points at once.
+        If the likelihood is not vectorised and a pool is being used, this
+        sets the number of points sent to each process at once.
     """
     allow_multi_valued_likelihood = False
     """
@@ -263,15 +266,13 @@ class Model(ABC):
             logger.info(
                 f"Starting multiprocessing pool with {n_pool} processes"
             )
-            import multiprocessing
             from nessai.utils.multiprocessing import (
-                check_multiprocessing_start_method,
+                get_multiprocessing_context,
                 initialise_pool_variables,
             )
 
-            check_multiprocessing_start_method()
-
-            self.pool = multiprocessing.Pool(
+            context = get_multiprocessing_context()
+            self.pool = context.Pool(
                 processes=self.n_pool,
                 initializer=initialise_pool_variables,
                 initargs=(self,),
@@ -406,13 +407,11 @@ class Model(ABC):
             Array with the same length as x where True indicates the point
             is within the prior bounds.
         """
-        return ~np.any(
-            [
-                (x[n] < self.bounds[n][0]) | (x[n] > self.bounds[n][1])
-                for n in self.names
-            ],
-            axis=0,
-        )
+        out_of_bounds = np.zeros(x.shape, dtype=bool)
+        for n in self.names:
+            out_of_bounds |= x[n] < self.bounds[n][0]
+            out_of_bounds |= x[n] > self.bounds[n][1]
+        return ~out_of_bounds
 
     def sample_parameter(self, name, n=1):
         """Draw samples for a specific parameter from the prior.
@@ -545,6 +544,20 @@ class Model(ABC):
                             np.array_split(x, self.n_pool),
                         )
                     )
+            elif self.likelihood_chunksize or self.n_pool:
+                # Send chunks of samples to each process rather than each
+                # sample, the likelihood is still evaluated one sample at a
+                # time within each chunk
+                if self.likelihood_chunksize:
+                    chunks = array_split_chunksize(
+                        x, self.likelihood_chunksize
+                    )
+                else:
+                    n_chunks = max(1, min(x.size, 4 * self.n_pool))
+                    chunks = np.array_split(x, n_chunks)
+                log_likelihood = np.concatenate(
+                    self.pool.map(batch_log_likelihood_wrapper, chunks)
+                )
             else:
                 log_likelihood = np.array(
                     self.pool.map(log_likelihood_wrapper, x)
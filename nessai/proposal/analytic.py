@@ -26,10 +26,13 @@ class AnalyticProposal(Proposal):
         Keyword arguments passed to the parent class.
     """
 
+    draw_mutates_input = False
+
     def __init__(self, *args, poolsize=1000, **kwargs):
         super(AnalyticProposal, self).__init__(*args, **kwargs)
         self.populated = False
         self._poolsize = poolsize
+        self._batch_indices = []
 
     @property
     def poolsize(self):
@@ -72,12 +75,78 @@ class AnalyticProposal(Proposal):
             Keyword arguments passed to \
                 :py:meth:`~nessai.proposal.analytic.AnalyticProposal.populate`
         """
+        return self._draw_from_pool(old_sample, 1, **kwargs)[0]
+
+    def _take_from_pool(self, N):
+        """Remove up to N samples from the pool.
+
+        Samples are taken in the same order as repeated calls to
+        :code:`indices.pop()`.
+        """
+        index = self.indices[: -N - 1 : -1]
+        del self.indices[-N:]
+        self._batch_indices = index
+        if not self.indices:
+            self.populated = False
+        return self.samples[index]
+
+    def _draw_from_pool(self, old_sample, n, **kwargs):
+        """Draw up to n samples from the pool, populating it if it is empty.
+
+        Used by both :py:meth:`draw` and :py:meth:`draw_batch`. Keyword
+        arguments are passed to :py:meth:`populate`.
+        """
         if not self.populated:
             st = datetime.datetime.now()
             self.populate(**kwargs)
             self.population_time += datetime.datetime.now() - st
-        index = self.indices.pop()
-        new_sample = self.samples[index]
-        if not self.indices:
-            self.populated = False
-        return new_sample
+        return self._take_from_pool(n)
+
+    def draw_batch(self, old_sample, N=1, **kwargs):
+        """
+        Propose a batch of up to N new samples. Draws from the pool if it is
+        populated, else it populates the pool.
+
+        The batch does not span multiple pools, so it may contain fewer than
+        N samples. If a subclass overrides :py:meth:`draw`, a single sample
+        is drawn with that method instead.
+
+        Parameters
+        ----------
+        old_sample : structured_array
+            Old sample, this is not used in the proposal method
+        N : int
+            Maximum number of samples to draw.
+        kwargs :
+            Keyword arguments passed to \
+                :py:meth:`~nessai.proposal.analytic.AnalyticProposal.populate`
+
+        Returns
+        -------
+        structured_array
+            Copy of the samples drawn from the pool.
+        """
+        if N < 1:
+            raise ValueError(f"N must be at least 1, got: {N}")
+        if type(self).draw is not AnalyticProposal.draw:
+            return super().draw_batch(old_sample, N=N)
+        return self._draw_from_pool(old_sample, N, **kwargs)
+
+    def return_samples(self, samples):
+        """Return the unused samples from the end of the previous batch to the
+        pool.
+
+        Any log-likelihood values that were computed for the samples are
+        stored in the pool, so they are not evaluated again.
+
+        Parameters
+        ----------
+        samples : structured_array
+            Samples at the end of the previous batch that were not used.
+        """
+        n = len(samples)
+        if n:
+            index = self._batch_indices[-n:]
+            self.samples["logL"][index] = samples["logL"]
+            self.indices.extend(index[::-1])
+            self.populated = True
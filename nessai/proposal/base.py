@@ -3,9 +3,12 @@
 Base object for all proposal classes.
 """
 from abc import ABC, abstractmethod
+from copy import copy
 import datetime
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +22,12 @@ class Proposal(ABC):
         User-defined model
     """
 
+    draw_mutates_input = True
+    """
+    Indicates whether :py:meth:`draw` may modify the old point it is given.
+    If True, the default :py:meth:`draw_batch` passes a copy of the old point.
+    """
+
     def __init__(self, model):
         self.model = model
         self.populated = True
@@ -68,6 +77,43 @@ class Proposal(ABC):
         """
         raise NotImplementedError
 
+    def draw_batch(self, old_param, N=1):
+        """Draw a batch of up to N new points given the old point.
+
+        The default implementation draws a single point with
+        :py:meth:`draw`. The old point is copied unless
+        :py:attr:`draw_mutates_input` is False. Proposals that store a
+        pool of samples should override this and :py:meth:`return_samples`.
+
+        Parameters
+        ----------
+        old_param : structured_array
+            Old point.
+        N : int
+            Maximum number of points to draw.
+
+        Returns
+        -------
+        structured_array
+            Array of new points.
+        """
+        if self.draw_mutates_input:
+            old_param = copy(old_param)
+        return np.atleast_1d(self.draw(old_param))
+
+    def return_samples(self, samples):
+        """Return the unused samples from the end of the previous batch.
+
+        Parameters
+        ----------
+        samples : structured_array
+            Samples at the end of the previous batch that were not used.
+        """
+        if len(samples):
+            raise RuntimeError(
+                f"{self.__class__.__name__} cannot return unused samples"
+            )
+
     def test_draw(self):
         """
         Test the draw method to ensure it returns a sample in the correct
@@ -26,6 +26,7 @@ from ..reparameterisations import (
     get_reparameterisation,
 )
 from ..plot import plot_live_points, plot_1d_comparison, nessai_style
+from .base import Proposal
 from .rejection import RejectionProposal
 from ..utils import (
     compute_radius,
@@ -545,7 +546,7 @@ class FlowProposal(RejectionProposal):
         acceptance : float
             Current acceptance.
         """
-        logger.debug(f"Updating poolsize with acceptance: {acceptance:.3f}")
+        logger.debug("Updating poolsize with acceptance: %.3f", acceptance)
         if not acceptance:
             logger.warning("Acceptance is zero, using maximum scale")
             self._poolsize_scale = self.max_poolsize_scale
@@ -1321,13 +1322,13 @@ class FlowProposal(RejectionProposal):
                 "Try calling `initialise()` first."
             )
         if r is not None:
-            logger.debug(f"Using user inputs for radius {r}")
+            logger.debug("Using user inputs for radius %s", r)
             worst_q = None
         elif self.fixed_radius:
             r = self.fixed_radius
             worst_q = None
         else:
-            logger.debug(f"Populating with worst point: {worst_point}")
+            logger.debug("Populating with worst point: %s", worst_point)
             if self.compute_radius_with_all:
                 logger.debug("Using previous live points to compute radius")
                 worst_point = self.training_data
@@ -1340,7 +1341,7 @@ class FlowProposal(RejectionProposal):
             if self.min_radius and r < self.min_radius:
                 r = self.min_radius
 
-        logger.debug(f"Populating proposal with lantent radius: {r:.5}")
+        logger.debug("Populating proposal with lantent radius: %.5g", r)
         self.r = r
 
         self.alt_dist = self.get_alt_distribution()
@@ -1401,14 +1402,14 @@ class FlowProposal(RejectionProposal):
             self.acceptance.append(
                 self.compute_acceptance(worst_point["logL"])
             )
-            logger.debug(f"Current acceptance {self.acceptance[-1]}")
+            logger.debug("Current acceptance %s", self.acceptance[-1])
 
         self.indices = np.random.permutation(self.samples.size).tolist()
         self.population_acceptance = self.x.size / proposed
         self.populated_count += 1
         self.populated = True
         self._checked_population = False
-        logger.debug(f"Proposal populated with {len(self.indices)} samples")
+        logger.debug("Proposal populated with %d samples", len(self.indices))
         logger.debug(
             f"Overall proposal acceptance: {self.x.size / proposed:.4}"
         )
@@ -1456,6 +1457,13 @@ class FlowProposal(RejectionProposal):
         structured_array
             New live point
         """
+        return self._draw_from_pool(worst_point, 1)[0]
+
+    def _draw_from_pool(self, worst_point, n):
+        """Draw up to n points from the pool, populating it if it is empty.
+
+        Used by both :py:meth:`draw` and :py:meth:`draw_batch`.
+        """
         if not self.populated:
             self.populating = True
             if self.update_poolsize:
@@ -1465,15 +1473,36 @@ class FlowProposal(RejectionProposal):
                 self.populate(worst_point, N=self.poolsize)
             self.population_time += datetime.datetime.now() - st
             self.populating = False
-        # new sample is drawn randomly from proposed points
-        # popping from right end is faster
-        index = self.indices.pop()
-        new_sample = self.samples[index]
-        if not self.indices:
-            self.populated = False
+        new_samples = self._take_from_pool(n)
+        if not self.populated:
             logger.debug("Proposal pool is empty")
-        # make live point and return
-        return new_sample
+        return new_samples
+
+    def draw_batch(self, worst_point, N=1):
+        """
+        Draw a batch of up to N replacement points. The batch does not span
+        multiple pools, so it may contain fewer than N points. If a subclass
+        overrides :py:meth:`draw`, a single point is drawn with that method
+        instead.
+
+        Parameters
+        ----------
+        worst_point : structured_array
+            The current worst point used to compute the radius of the contour
+            in the latent space.
+        N : int
+            Maximum number of points to draw.
+
+        Returns
+        -------
+        structured_array
+            New live points
+        """
+        if N < 1:
+            raise ValueError(f"N must be at least 1, got: {N}")
+        if type(self).draw is not FlowProposal.draw:
+            return Proposal.draw_batch(self, worst_point, N=N)
+        return self._draw_from_pool(worst_point, N)
 
     @nessai_style()
     def plot_pool(self, z, x):
@@ -1603,6 +1632,7 @@ class FlowProposal(RejectionProposal):
     def reset(self):
         """Reset the proposal"""
         self.indices = []
+        self._batch_indices = []
         self.samples = None
         self.x = None
         self.populated = False
@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 import datetime
 import logging
 import os
-import pickle
 import time
 from typing import Any, Optional, Union
 
@@ -14,7 +13,7 @@ import torch
 
 from .. import __version__ as version
 from ..model import Model
-from ..utils import safe_file_dump
+from ..utils import checkpointing, safe_file_dump
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +59,10 @@ class BaseNestedSampler(ABC):
         the likelihood.
     """
 
+    _checkpoint_arrays = ()
+    """Names of array attributes that are written in the NumPy format when
+    checkpointing instead of being pickled."""
+
     def __init__(
         self,
         model: Model,
@@ -254,7 +257,9 @@ class BaseNestedSampler(ABC):
                     return
         self.sampling_time += now - self.sampling_start_time
         logger.info("Checkpointing nested sampling")
-        safe_file_dump(self, self.resume_file, pickle, save_existing=True)
+        safe_file_dump(
+            self, self.resume_file, checkpointing, save_existing=True
+        )
         self.sampling_start_time = datetime.datetime.now()
 
     @classmethod
@@ -274,7 +279,7 @@ class BaseNestedSampler(ABC):
         """
         logger.info("Resuming NestedSampler from " + filename)
         with open(filename, "rb") as f:
-            obj = pickle.load(f)
+            obj = checkpointing.load(f)
         model.likelihood_evaluations += obj._previous_likelihood_evaluations
         model.likelihood_evaluation_time += datetime.timedelta(
             seconds=obj._previous_likelihood_evaluation_time
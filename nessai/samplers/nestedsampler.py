@@ -2,8 +2,6 @@
 """
 Functions and objects related to the main nested sampling algorithm.
 """
-from collections import deque
-from copy import copy
 import datetime
 import logging
 import os
@@ -16,18 +14,26 @@ from tqdm import tqdm
 
 from .base import BaseNestedSampler
 from .. import config
-from ..livepoint import empty_structured_array, live_points_to_dict
+from ..livepoint import (
+    copy_structured_array,
+    empty_structured_array,
+    live_points_to_dict,
+)
 from ..plot import plot_indices, plot_trace, nessai_style
-from ..evidence import _NSIntegralState
+from ..evidence import _NSIntegralState, _log1pexp
 from ..proposal import FlowProposal
 from ..proposal.utils import check_proposal_kwargs
 from ..utils import (
     compute_indices_ks_test,
     rolling_mean,
 )
+from ..utils.structures import AppendableArray, RingBuffer
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DRAW_BATCH_SIZE = 64
+"""Default maximum number of points drawn from the proposal at once."""
+
 
 class NestedSampler(BaseNestedSampler):
     """
@@ -144,10 +150,26 @@ class NestedSampler(BaseNestedSampler):
     shrinkage_expectation : str, {"t", "logt"}
         Method used to compute the expectation value for the shrinkage t.
         Choose between log <t> or <log t>. Defaults to <log t>.
+    plotting_interval : float, optional
+        Minimum time in seconds between updating the state and trace plots
+        during sampling. If None (default), the plots are updated every nlive
+        iterations. The plots are always updated at the end of sampling.
+    draw_batch_size : int, optional
+        Maximum number of points to draw from the proposal at once when
+        replacing the worst live point. Points after the accepted point are
+        returned to the proposal.
     kwargs :
         Keyword arguments passed to the flow proposal class
     """
 
+    _checkpoint_arrays = (
+        "live_points",
+        "_nested_samples",
+        "_insertion_indices",
+        "_order",
+        "_sorted_logL",
+    )
+
     def __init__(
         self,
         model,
@@ -187,6 +209,8 @@ class NestedSampler(BaseNestedSampler):
         reset_acceptance=False,
         acceptance_threshold=0.01,
         shrinkage_expectation="logt",
+        plotting_interval=None,
+        draw_batch_size=DEFAULT_DRAW_BATCH_SIZE,
         **kwargs,
     ):
 
@@ -209,22 +233,30 @@ class NestedSampler(BaseNestedSampler):
         self._close_pool = close_pool
 
         self.live_points = None
+        self.draw_batch_size = draw_batch_size
+        self._order = None
+        self._sorted_logL = None
         self.prior_sampling = prior_sampling
         self.accepted = 0
         self.rejected = 1
         self.initialised = False
 
         self.checkpoint_on_training = checkpoint_on_training
+        self.plotting_interval = plotting_interval
+        self._last_plot_time = None
         self.iteration = 0
-        self.acceptance_history = deque(maxlen=(nlive // 10))
-        self.mean_acceptance_history = []
+        # Interval in iterations at which the history is updated
+        self._history_interval = max(1, nlive // 10)
+        self.acceptance_history = RingBuffer(nlive // 10)
+        self.mean_acceptance_history = AppendableArray(np.float32)
         self.block_acceptance = 1.0
         self.mean_block_acceptance = 1.0
         self.block_iteration = 0
         self.retrain_acceptance = retrain_acceptance
         self.reset_acceptance = reset_acceptance
 
-        self.insertion_indices = []
+        self._insertion_indices = np.empty(max(16 * nlive, 4096), dtype=int)
+        self._ii_n = 0
         self.rolling_p = []
         self.final_p_value = None
         self.final_ks_statistic = None
@@ -234,7 +266,8 @@ class NestedSampler(BaseNestedSampler):
         self.condition = np.inf
         self.logLmin = -np.inf
         self.logLmax = -np.inf
-        self.nested_samples = []
+        self._nested_samples = None
+        self._ns_n = 0
         self.logZ = None
         self.state = _NSIntegralState(
             self.nlive,
@@ -248,16 +281,17 @@ class NestedSampler(BaseNestedSampler):
         # Resume flags
         self.completed_training = True
 
-        # History
-        self.likelihood_evaluations = []
+        # History, diagnostics that are only used for plotting are stored
+        # in single precision
+        self.likelihood_evaluations = AppendableArray(int)
         self.training_iterations = []
-        self.min_likelihood = []
-        self.max_likelihood = []
-        self.logZ_history = []
-        self.dZ_history = []
-        self.population_acceptance = []
-        self.population_radii = []
-        self.population_iterations = []
+        self.min_likelihood = AppendableArray(float)
+        self.max_likelihood = AppendableArray(float)
+        self.logZ_history = AppendableArray(float)
+        self.dZ_history = AppendableArray(np.float32)
+        self.population_acceptance = AppendableArray(np.float32)
+        self.population_radii = AppendableArray(np.float32)
+        self.population_iterations = AppendableArray(int)
         self.checkpoint_iterations = []
 
         self.acceptance_threshold = acceptance_threshold
@@ -324,10 +358,7 @@ class NestedSampler(BaseNestedSampler):
         """
         Mean acceptance of the last nlive // 10 points
         """
-        if self.acceptance_history:
-            return np.mean(self.acceptance_history)
-        else:
-            return np.nan
+        return self.acceptance_history.mean
 
     def configure_max_iteration(self, max_iteration):
         """Configure the maximum iteration.
@@ -540,6 +571,9 @@ class NestedSampler(BaseNestedSampler):
 
     def log_state(self):
         """Log the current state of the sampler"""
+        # Avoid formatting the message if it will not be logged
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(
             f"it: {self.iteration:5d}: "
             f"n eval: {self.likelihood_calls} "
@@ -554,6 +588,17 @@ class NestedSampler(BaseNestedSampler):
         Checking the distribution of the insertion indices either during
         the nested sampling run (rolling=True) or for the whole run
         (rolling=False).
+
+        Parameters
+        ----------
+        rolling : bool
+            If True, only the insertion indices from the last nlive
+            iterations are used.
+        filename : str, optional
+            If specified, the insertion indices are saved to this file. Files
+            with a :code:`.txt` extension are saved as text, otherwise the
+            indices are saved in binary NumPy format using
+            :code:`numpy.save`.
         """
         if rolling:
             indices = self.insertion_indices[-self.nlive :]
@@ -564,10 +609,11 @@ class NestedSampler(BaseNestedSampler):
 
         if p is not None:
             if rolling:
-                logger.info(
-                    f"it: {self.iteration:5d}: "
-                    f"Rolling KS test: D={D:.4}, p-value={p:.4}"
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        f"it: {self.iteration:5d}: "
+                        f"Rolling KS test: D={D:.4}, p-value={p:.4}"
+                    )
                 self.rolling_p.append(p)
             else:
                 logger.info(f"Final KS test: D={D:.4}, p-value={p:.4}")
@@ -583,65 +629,223 @@ class NestedSampler(BaseNestedSampler):
                     )
 
         if filename is not None:
-            np.savetxt(
-                os.path.join(self.output, filename),
-                self.insertion_indices,
-                newline="\n",
-                delimiter=" ",
-            )
+            path = os.path.join(self.output, filename)
+            if os.path.splitext(filename)[1] == ".txt":
+                np.savetxt(
+                    path, self.insertion_indices, newline="\n", delimiter=" "
+                )
+            else:
+                np.save(path, self.insertion_indices)
+
+    def _evaluate_candidates_with_pool(self, batch, candidates):
+        """Evaluate the candidates in chunks using the likelihood pool.
+
+        Candidates are evaluated :code:`n_pool` at a time so that the
+        evaluations run in parallel and at most one chunk is evaluated beyond
+        the first point that is accepted.
+
+        Parameters
+        ----------
+        batch : numpy.ndarray
+            Batch of samples drawn from the proposal. The log-likelihood
+            values are updated in-place.
+        candidates : numpy.ndarray
+            Indices of the points in the batch that could be accepted.
+
+        Returns
+        -------
+        int or None
+            Index of the first point that is accepted or None if no points
+            are accepted.
+        """
+        n = getattr(self.model, "n_pool", None) or 1
+        for start in range(0, candidates.size, n):
+            chunk = candidates[start : start + n]
+            idx = chunk[batch["logL"][chunk] == 0]
+            if idx.size:
+                logL = self.model.batch_evaluate_log_likelihood(batch[idx])
+                batch["logL"][idx] = logL
+            above = chunk[batch["logL"][chunk] > self.logLmin]
+            if above.size:
+                return above[0]
+        return None
 
     def yield_sample(self, oldparam):
         """
         Draw points and applying rejection sampling
+
+        Points are drawn from the proposal in batches of up to
+        :code:`draw_batch_size` and any points after the accepted point are
+        returned to the proposal.
         """
         while True:
             counter = 0
             while True:
-                counter += 1
-                newparam = self.proposal.draw(copy(oldparam))
-
-                # Prior is computed in the proposal
-                if newparam["logP"] != -np.inf:
-                    if not newparam["logL"]:
-                        newparam["logL"] = self.model.evaluate_log_likelihood(
-                            newparam
-                        )
-                    if newparam["logL"] > self.logLmin:
-                        self.logLmax = max(self.logLmax, newparam["logL"])
-                        oldparam = newparam.copy()
-                        break
+                batch = self.proposal.draw_batch(
+                    oldparam, N=self.draw_batch_size
+                )
+                # Prior is computed in the proposal. Only points with a finite
+                # prior and either a likelihood that has not been evaluated or
+                # one above the current threshold can be accepted.
+                candidates = np.flatnonzero(
+                    (batch["logP"] != -np.inf)
+                    & ((batch["logL"] == 0) | (batch["logL"] > self.logLmin))
+                )
+                if self.model.pool is None:
+                    accepted = None
+                    # View of the field, so changes are written to the batch
+                    logL = batch["logL"]
+                    for i in candidates:
+                        if not logL[i]:
+                            logL[i] = self.model.evaluate_log_likelihood(
+                                batch[i]
+                            )
+                        if logL[i] > self.logLmin:
+                            accepted = i
+                            break
+                else:
+                    # Evaluate chunks of candidates in parallel
+                    accepted = self._evaluate_candidates_with_pool(
+                        batch, candidates
+                    )
+                if accepted is not None:
+                    counter += accepted + 1
+                    self.proposal.return_samples(batch[accepted + 1 :])
+                    newparam = batch[accepted]
+                    self.logLmax = max(self.logLmax, newparam["logL"])
+                    oldparam = newparam
+                    break
+                counter += batch.size
                 # Only here if proposed and then empty
                 # This returns the old point and allows for a training check
                 if not self.proposal.populated:
                     break
             yield counter, oldparam
 
+    @property
+    def insertion_indices(self):
+        """Insertion indices of the points that have been accepted.
+
+        Indices are stored in a preallocated buffer that grows geometrically,
+        this returns a view of the indices that have been added so far.
+        """
+        return self._insertion_indices[: self._ii_n]
+
+    @insertion_indices.setter
+    def insertion_indices(self, indices):
+        self._insertion_indices = np.array(indices, dtype=int)
+        self._ii_n = self._insertion_indices.size
+
+    def _add_insertion_index(self, index):
+        """Add an insertion index to the buffer, growing it if it is full."""
+        if self._ii_n == self._insertion_indices.size:
+            self._insertion_indices = np.resize(
+                self._insertion_indices, max(2 * self._ii_n, 1)
+            )
+        self._insertion_indices[self._ii_n] = index
+        self._ii_n += 1
+
+    @property
+    def nested_samples(self):
+        """The nested samples.
+
+        Samples are stored in a preallocated buffer that grows geometrically,
+        this returns a view of the samples that have been added so far.
+        """
+        if self._nested_samples is None:
+            return empty_structured_array(0, names=self.model.names)
+        return self._nested_samples[: self._ns_n]
+
+    @nested_samples.setter
+    def nested_samples(self, samples):
+        samples = np.asarray(samples)
+        if not samples.size:
+            self._nested_samples = None
+            self._ns_n = 0
+        else:
+            self._nested_samples = copy_structured_array(samples)
+            self._ns_n = samples.size
+
+    def _add_nested_samples(self, samples):
+        """Add samples to the buffer of nested samples.
+
+        Parameters
+        ----------
+        samples : numpy.ndarray
+            Sample or array of samples to add.
+
+        Returns
+        -------
+        numpy.ndarray
+            View of the samples in the buffer.
+        """
+        samples = np.atleast_1d(samples)
+        n = self._ns_n + samples.size
+        if self._nested_samples is None:
+            self._nested_samples = np.empty(
+                max(16 * self.nlive, 4096, n), dtype=samples.dtype
+            )
+        elif n > self._nested_samples.size:
+            capacity = self._nested_samples.size
+            while capacity < n:
+                capacity *= 2
+            buffer = np.empty(capacity, dtype=self._nested_samples.dtype)
+            copy_structured_array(
+                self._nested_samples, out=buffer[: self._nested_samples.size]
+            )
+            self._nested_samples = buffer
+        self._nested_samples[self._ns_n : n] = samples
+        start, self._ns_n = self._ns_n, n
+        return self._nested_samples[start:n]
+
+    @property
+    def sorted_live_points(self):
+        """The current live points sorted by log-likelihood.
+
+        The live points are stored unsorted and :code:`_order` contains the
+        indices that sort them, so this returns a copy.
+        """
+        return self.live_points[self._order]
+
     def insert_live_point(self, live_point):
         """
         Insert a live point
+
+        The new point replaces the current worst point in
+        :code:`live_points` and only the (much smaller) index array
+        :code:`_order` and the contiguous array of sorted log-likelihoods
+        :code:`_sorted_logL` are shifted to keep track of the ordering.
         """
+        logL = live_point["logL"]
         # This is the index including the current worst point, so final index
         # is one less, otherwise index=0 would never be possible
-        index = np.searchsorted(self.live_points["logL"], live_point["logL"])
-        self.live_points[: index - 1] = self.live_points[1:index]
-        self.live_points[index - 1] = live_point
+        index = np.searchsorted(self._sorted_logL, logL)
+        slot = self._order[0]
+        self._order[: index - 1] = self._order[1:index]
+        self._order[index - 1] = slot
+        self._sorted_logL[: index - 1] = self._sorted_logL[1:index]
+        self._sorted_logL[index - 1] = logL
+        self.live_points[slot] = live_point
         return index - 1
 
     def consume_sample(self):
         """
         Replace a sample for single thread
         """
-        worst = self.live_points[0].copy()
+        # The worst point is copied into the nested samples buffer, so the
+        # entry in the buffer is used instead of making another copy.
+        # Entries in the buffer are never overwritten. The view is read-only
+        # so a proposal that modifies the old point raises an error instead
+        # of changing the nested samples.
+        worst = self._add_nested_samples(self.live_points[self._order[0]])
+        worst.setflags(write=False)
+        worst = worst[0]
         self.logLmin = worst["logL"]
         self.state.increment(worst["logL"])
-        self.nested_samples.append(worst)
 
-        self.condition = (
-            np.logaddexp(
-                self.state.logZ,
-                self.logLmax - self.iteration / float(self.nlive),
-            )
-            - self.state.logZ
+        # logaddexp(logZ, logLmax + logX) - logZ
+        self.condition = _log1pexp(
+            self.logLmax - self.iteration / self.nlive - self.state.logZ
         )
 
         # Replace the points we just consumed with the next acceptable ones
@@ -659,7 +863,7 @@ class NestedSampler(BaseNestedSampler):
                 # replace worst point with new one
                 proposed["it"] = self.iteration
                 index = self.insert_live_point(proposed)
-                self.insertion_indices.append(index)
+                self._add_insertion_index(index)
                 self.accepted += 1
                 self.block_acceptance += 1 / count
                 self.acceptance_history.append(1 / count)
@@ -693,6 +897,10 @@ class NestedSampler(BaseNestedSampler):
     def populate_live_points(self):
         """
         Initialise the pool of live points.
+
+        Points are drawn from the current proposal in batches and the
+        log-likelihood is evaluated for all of the points in a batch with a
+        finite log-prior at once.
         """
         i = 0
         live_points = empty_structured_array(
@@ -701,29 +909,40 @@ class NestedSampler(BaseNestedSampler):
 
         with tqdm(total=self.nlive, desc="Drawing live points") as pbar:
             while i < self.nlive:
-                while i < self.nlive:
-                    _, live_point = next(self.yield_sample(None))
-                    if live_point is None:
-                        break
-                    if np.isnan(live_point["logL"]):
-                        logger.error(
-                            "Likelihood function returned NaN for "
-                            f"live_point {live_point}"
-                        )
-                        logger.error(
-                            "You may want to check your likelihood function"
-                        )
-                        break
-                    if np.isfinite(live_point["logP"]) and np.isfinite(
-                        live_point["logL"]
-                    ):
-                        live_points[i] = live_point
-                        i += 1
-                        pbar.update()
-                        break
-
-        self.live_points = np.sort(live_points, order="logL")
+                batch = self.proposal.draw_batch(None, N=self.nlive - i)
+                batch = batch[np.isfinite(batch["logP"])]
+                if not batch.size:
+                    continue
+                # Likelihood is only evaluated for points where the proposal
+                # has not already evaluated it
+                idx = np.flatnonzero(batch["logL"] == 0)
+                if idx.size:
+                    logL = self.model.batch_evaluate_log_likelihood(batch[idx])
+                    batch["logL"][idx] = logL
+                nans = np.isnan(batch["logL"])
+                if nans.any():
+                    logger.error(
+                        "Likelihood function returned NaN for "
+                        f"live_point(s) {batch[nans]}"
+                    )
+                    logger.error(
+                        "You may want to check your likelihood function"
+                    )
+                batch = batch[np.isfinite(batch["logL"])]
+                n = batch.size
+                live_points[i : i + n] = batch
+                i += n
+                pbar.update(n)
+
+        # Sort on the log-likelihood field alone, sorting the structured
+        # array compares entire records
+        logL = live_points["logL"]
+        order = np.argsort(logL, kind="stable")
+        self.live_points = live_points[order]
         self.live_points["it"] = 0
+        self._sorted_logL = logL[order]
+        self.logLmax = max(self.logLmax, self._sorted_logL[-1])
+        self._order = np.arange(self.nlive, dtype=np.int32)
 
     def initialise(self, live_points=True):
         """
@@ -890,10 +1109,10 @@ class NestedSampler(BaseNestedSampler):
             self.completed_training = False
             self.check_flow_model_reset()
 
-            training_data = self.live_points.copy()
+            training_data = copy_structured_array(self.live_points)
             if self.memory and (len(self.nested_samples) >= self.memory):
                 training_data = np.concatenate(
-                    [training_data, self.nested_samples[-self.memory :].copy()]
+                    [training_data, self.nested_samples[-self.memory :]]
                 )
 
             st = datetime.datetime.now()
@@ -945,7 +1164,7 @@ class NestedSampler(BaseNestedSampler):
 
         fig, ax = plt.subplots(7, 1, sharex=True, figsize=(12, 12))
         ax = ax.ravel()
-        it = (np.arange(len(self.min_likelihood))) * (self.nlive // 10)
+        it = np.arange(len(self.min_likelihood)) * self._history_interval
         it[-1] = self.iteration
 
         for i in self.checkpoint_iterations:
@@ -1082,7 +1301,7 @@ class NestedSampler(BaseNestedSampler):
             Additional keyword arguments passed to
             :py:func:`nessai.plot.plot_trace`.
         """
-        if self.nested_samples:
+        if self.nested_samples.size:
             fig = plot_trace(
                 self.state.log_vols[1:],
                 self.nested_samples,
@@ -1123,7 +1342,7 @@ class NestedSampler(BaseNestedSampler):
             self.population_iterations.append(self.iteration)
             self.proposal._checked_population = True
 
-        if not (self.iteration % (self.nlive // 10)) or force:
+        if not (self.iteration % self._history_interval) or force:
             self.likelihood_evaluations.append(
                 self.model.likelihood_evaluations
             )
@@ -1148,7 +1367,15 @@ class NestedSampler(BaseNestedSampler):
                         ),
                     )
 
-            if self.plot:
+            now = datetime.datetime.now()
+            if self.plot and (
+                force
+                or self.plotting_interval is None
+                or self._last_plot_time is None
+                or (now - self._last_plot_time).total_seconds()
+                >= self.plotting_interval
+            ):
+                self._last_plot_time = now
                 self.plot_state(
                     filename=os.path.join(self.output, "state.png")
                 )
@@ -1190,9 +1417,11 @@ class NestedSampler(BaseNestedSampler):
         Finalise things after sampling
         """
         logger.info("Finalising")
-        for i, p in enumerate(self.live_points):
-            self.state.increment(p["logL"], nlive=self.nlive - i)
-            self.nested_samples.append(p)
+        live_points = self.sorted_live_points
+        self.state.increment_batch(
+            live_points["logL"], nlive=np.arange(self.nlive, 0, -1)
+        )
+        self._add_nested_samples(live_points)
 
         # Refine evidence estimate
         self.update_state(force=True)
@@ -1223,7 +1452,9 @@ class NestedSampler(BaseNestedSampler):
             if self._close_pool:
                 self.close_pool()
             self.finalise()
-            return self.log_evidence, np.array(self.nested_samples)
+            return self.log_evidence, copy_structured_array(
+                self.nested_samples
+            )
 
         self.check_resume()
 
@@ -1274,25 +1505,27 @@ class NestedSampler(BaseNestedSampler):
             f"{self.likelihood_evaluation_time}"
         )
 
-        return self.state.logZ, np.array(self.nested_samples)
+        return self.state.logZ, copy_structured_array(self.nested_samples)
 
     def get_result_dictionary(self):
         """Return a dictionary that contains results"""
         d = super().get_result_dictionary()
-        iterations = np.arange(len(self.min_likelihood)) * (self.nlive // 10)
+        iterations = (
+            np.arange(len(self.min_likelihood)) * self._history_interval
+        )
         iterations[-1] = self.iteration
         d["history"] = dict(
             iterations=iterations,
-            min_likelihood=self.min_likelihood,
-            max_likelihood=self.max_likelihood,
-            likelihood_evaluations=self.likelihood_evaluations,
-            logZ=self.logZ_history,
-            dZ=self.dZ_history,
-            mean_acceptance=self.mean_acceptance_history,
+            min_likelihood=np.asarray(self.min_likelihood),
+            max_likelihood=np.asarray(self.max_likelihood),
+            likelihood_evaluations=np.asarray(self.likelihood_evaluations),
+            logZ=np.asarray(self.logZ_history),
+            dZ=np.asarray(self.dZ_history),
+            mean_acceptance=np.asarray(self.mean_acceptance_history),
             rolling_p=self.rolling_p,
             population=dict(
-                iterations=self.population_iterations,
-                acceptance=self.population_acceptance,
+                iterations=np.asarray(self.population_iterations),
+                acceptance=np.asarray(self.population_acceptance),
             ),
             training_iterations=self.training_iterations,
         )
@@ -1300,7 +1533,7 @@ class NestedSampler(BaseNestedSampler):
         d["final_p_value"] = self.final_p_value
         d["final_ks_statistic"] = self.final_ks_statistic
         d["nested_samples"] = live_points_to_dict(
-            np.array(self.nested_samples)
+            self.nested_samples, copy=True
         )
         d["log_evidence"] = self.log_evidence
         d["log_evidence_error"] = self.state.log_evidence_error
@@ -1337,3 +1570,57 @@ class NestedSampler(BaseNestedSampler):
             flow_config = {}
         obj._flow_proposal.resume(model, flow_config, weights_file)
         return obj
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # Only save the parts of the buffers that have been filled
+        if state.get("_nested_samples") is not None:
+            state["_nested_samples"] = copy_structured_array(
+                self.nested_samples
+            )
+        if state.get("_insertion_indices") is not None:
+            state["_insertion_indices"] = self.insertion_indices.copy()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "_history_interval" in state:
+            return
+        # Resume files written before the history was stored in typed buffers
+        # contain lists and a deque, convert them so the run can be resumed.
+        d = self.__dict__
+        logger.debug("Converting state from an older resume file")
+        acceptance_history = d["acceptance_history"]
+        self.acceptance_history = RingBuffer(acceptance_history.maxlen)
+        for a in acceptance_history:
+            self.acceptance_history.append(a)
+        for name, dtype in [
+            ("mean_acceptance_history", np.float32),
+            ("likelihood_evaluations", int),
+            ("min_likelihood", float),
+            ("max_likelihood", float),
+            ("logZ_history", float),
+            ("dZ_history", np.float32),
+            ("population_acceptance", np.float32),
+            ("population_radii", np.float32),
+            ("population_iterations", int),
+        ]:
+            values = d[name]
+            d[name] = AppendableArray(dtype, capacity=max(len(values), 128))
+            for v in values:
+                d[name].append(v)
+        # Remove the old attributes so the properties are not shadowed
+        self.insertion_indices = d.pop("insertion_indices")
+        self.nested_samples = d.pop("nested_samples")
+        self._history_interval = max(1, self.nlive // 10)
+        d.setdefault("draw_batch_size", DEFAULT_DRAW_BATCH_SIZE)
+        self.plotting_interval = None
+        self._last_plot_time = None
+        self._order = None
+        self._sorted_logL = None
+        if self.live_points is not None:
+            logL = self.live_points["logL"]
+            order = np.argsort(logL, kind="stable")
+            self.live_points = self.live_points[order]
+            self._sorted_logL = logL[order]
+            self._order = np.arange(self.live_points.size, dtype=np.int32)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Functions for writing and reading checkpoint files.
+
+Checkpoints are pickle files where selected array attributes are written in
+the NumPy :code:`.npy` format after the pickled state instead of being
+pickled. The functions have the same interface as :code:`pickle` so this
+module can be used with :py:func:`nessai.utils.io.safe_file_dump`.
+
+Files written with :py:func:`dump` contain a pickled tuple of the class,
+the remaining state and the names of the arrays, followed by each array in
+the :code:`.npy` format. They must be read with :py:func:`load` rather
+than :code:`pickle.load`.
+"""
+import pickle
+
+import numpy as np
+
+
+def dump(obj, file):
+    """Write an object to an open file.
+
+    The arrays listed in the :code:`_checkpoint_arrays` attribute of the
+    object are removed from the state returned by :code:`__getstate__`, or
+    :code:`__dict__` if it is not defined, and written with
+    :py:func:`numpy.save`, which avoids copying them into the pickle. The remaining state is pickled with the highest protocol
+    available, so any other arrays are written as contiguous buffers.
+
+    Parameters
+    ----------
+    obj : object
+        Object to write.
+    file : file-like
+        File opened in binary mode.
+    """
+    if hasattr(obj, "__getstate__"):
+        state = dict(obj.__getstate__())
+    else:
+        state = obj.__dict__.copy()
+    names = [
+        name
+        for name in getattr(obj, "_checkpoint_arrays", ())
+        if isinstance(state.get(name), np.ndarray)
+        and not state[name].dtype.hasobject
+    ]
+    arrays = [state.pop(name) for name in names]
+    pickle.dump(
+        (type(obj), state, names), file, protocol=pickle.HIGHEST_PROTOCOL
+    )
+    for array in arrays:
+        np.save(file, array, allow_pickle=False)
+
+
+def load(file):
+    """Read an object written with :py:func:`dump` from an open file.
+
+    Also supports files that contain a single pickled object.
+
+    Parameters
+    ----------
+    file : file-like
+        File opened in binary mode.
+
+    Returns
+    -------
+    object
+        The object with the arrays restored.
+    """
+    data = pickle.load(file)
+    if not (
+        isinstance(data, tuple)
+        and len(data) == 3
+        and isinstance(data[0], type)
+    ):
+        return data
+    cls, state, names = data
+    for name in names:
+        state[name] = np.load(file, allow_pickle=False)
+    obj = cls.__new__(cls)
+    if hasattr(obj, "__setstate__"):
+        obj.__setstate__(state)
+    else:
+        obj.__dict__.update(state)
+    return obj
@@ -26,9 +26,7 @@ def compute_indices_ks_test(indices, nlive, mode="D+"):
         p-value
     """
     if len(indices):
-        counts = np.zeros(nlive)
-        u, c = np.unique(indices, return_counts=True)
-        counts[u] = c
+        counts = np.bincount(np.asarray(indices, dtype=int), minlength=nlive)
         cdf = np.cumsum(counts) / len(indices)
         if mode == "D+":
             D = np.max(np.arange(1.0, nlive + 1) / nlive - cdf)
@@ -5,6 +5,10 @@ Utilities related to multiprocessing.
 import logging
 import multiprocessing
 
+import numpy as np
+
+from .. import config
+
 _model = None
 logger = logging.getLogger(__name__)
 
@@ -50,6 +54,39 @@ def check_multiprocessing_start_method():
         )
 
 
+def get_multiprocessing_context():
+    """Get the multiprocessing context used for pools created by nessai.
+
+    If the start method has not been set, the `fork` context is used, so
+    workers inherit the model from the parent process instead of re-importing
+    it. If the user has set the start method, the default context is used
+    instead and the start method must be `fork`. Other start methods are not
+    supported since the workers rely on inheriting the model.
+
+    Returns
+    -------
+    :obj:`multiprocessing.context.BaseContext`
+        Multiprocessing context with the `fork` start method.
+
+    Raises
+    ------
+    RuntimeError
+        If the start method has been set to a method other than `fork` or
+        the `fork` start method is not available on this platform.
+    """
+    if multiprocessing.get_start_method(allow_none=True) is not None:
+        check_multiprocessing_start_method()
+        return multiprocessing.get_context()
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        raise RuntimeError(
+            "nessai only supports multiprocessing using the 'fork' start "
+            "method, which is not available on this platform. See the "
+            "multiprocessing documentation for more details."
+        )
+
+
 def initialise_pool_variables(model):
     """Prepare the model for use with a multiprocessing pool.
 
@@ -83,3 +120,28 @@ def log_likelihood_wrapper(x):
         Array of log-likelihoods.
     """
     return _model.log_likelihood(x)
+
+
+def batch_log_likelihood_wrapper(x):
+    """Wrapper for evaluating a log-likelihood that is not vectorised for a
+    batch of samples with multiprocessing.
+
+    The samples are evaluated one at a time in the worker, so only a single
+    array is sent to each process instead of each individual sample.
+
+    Should be used alongside
+    :py:func:`nessai.utils.multiprocessing.initialise_pool_variables`
+
+    Parameters
+    ----------
+    x : :obj:`numpy.ndarray`
+        Array of samples.
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+        Array of log-likelihoods.
+    """
+    return np.fromiter(
+        map(_model.log_likelihood, x), config.livepoints.logl_dtype, x.size
+    )
@@ -307,8 +307,9 @@ def logit(x, eps=None):
     """
     if eps:
         x = np.clip(x, eps, 1 - eps)
-    log_j = -np.log(x) - np.log1p(-x)
-    return np.log(x) - np.log1p(-x), log_j
+    log_x = np.log(x)
+    log_1mx = np.log1p(-x)
+    return log_x - log_1mx, -log_x - log_1mx
 
 
 def sigmoid(x):
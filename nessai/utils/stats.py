@@ -3,12 +3,15 @@
 Utilities related to statistics.
 """
 import numpy as np
-from scipy.special import logsumexp
 
 
 def effective_sample_size(log_w):
     """Compute Kish's effective sample size.
 
+    The weights are exponentiated once after subtracting the maximum, which
+    is equivalent to normalising them since the effective sample size does
+    not depend on the normalisation.
+
     Parameters
     ----------
     log_w : array_like
@@ -19,10 +22,9 @@ def effective_sample_size(log_w):
     float
         The effective sample size.
     """
-    log_w = np.array(log_w)
-    log_w -= logsumexp(log_w)
-    n = np.exp(-logsumexp(2 * log_w))
-    return n
+    log_w = np.asarray(log_w)
+    w = np.exp(log_w - log_w.max())
+    return w.sum() ** 2 / np.dot(w, w)
 
 
 def rolling_mean(x, N=10):
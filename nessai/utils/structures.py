@@ -97,3 +97,120 @@ def array_split_chunksize(x, chunksize):
     if chunksize < 1:
         raise ValueError("chunksize must be greater than 1")
     return np.array_split(x, range(chunksize, len(x), chunksize))
+
+
+class RingBuffer:
+    """Fixed-size buffer of floats that tracks the mean of its contents.
+
+    Once full, new values overwrite the oldest values. The sum of the values
+    is updated incrementally, so computing the mean does not require a pass
+    over the buffer.
+
+    Parameters
+    ----------
+    size : int
+        Maximum number of values to store.
+    """
+
+    def __init__(self, size):
+        self._buffer = np.zeros(max(size, 0))
+        self._index = 0
+        self._count = 0
+        self._sum = 0.0
+
+    @property
+    def size(self):
+        """Maximum number of values that can be stored."""
+        return self._buffer.size
+
+    def append(self, value):
+        """Add a value to the buffer, replacing the oldest value if full.
+
+        Parameters
+        ----------
+        value : float
+            Value to add.
+        """
+        if not self.size:
+            return
+        self._sum += value - self._buffer[self._index]
+        self._buffer[self._index] = value
+        self._index = (self._index + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+        if self._index == 0:
+            # Recompute the sum to avoid accumulating rounding errors
+            self._sum = self._buffer.sum()
+
+    @property
+    def mean(self):
+        """Mean of the values in the buffer, NaN if it is empty."""
+        if not self._count:
+            return np.nan
+        return self._sum / self._count
+
+    def __len__(self):
+        return self._count
+
+    def __array__(self, dtype=None):
+        """Values in the order they were added."""
+        if self._count < self.size:
+            values = self._buffer[: self._count]
+        else:
+            values = np.roll(self._buffer, -self._index)
+        return np.array(values, dtype=dtype)
+
+
+class AppendableArray:
+    """Array of a fixed dtype that values can be appended to.
+
+    Values are stored in a preallocated array that grows geometrically, which
+    avoids storing each value as a Python object.
+
+    Parameters
+    ----------
+    dtype : numpy.dtype, optional
+        Data type of the values.
+    capacity : int, optional
+        Initial number of values that can be stored before the array is
+        resized.
+    """
+
+    def __init__(self, dtype=float, capacity=128):
+        self._data = np.empty(max(capacity, 1), dtype=dtype)
+        self._n = 0
+
+    @property
+    def dtype(self):
+        """Data type of the values."""
+        return self._data.dtype
+
+    @property
+    def values(self):
+        """View of the values that have been added."""
+        return self._data[: self._n]
+
+    def append(self, value):
+        """Add a value to the end of the array.
+
+        Parameters
+        ----------
+        value : Any
+            Value to add, must be compatible with the dtype.
+        """
+        if self._n == self._data.size:
+            self._data = np.resize(self._data, max(2 * self._data.size, 1))
+        self._data[self._n] = value
+        self._n += 1
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, item):
+        return self.values[item]
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.values, dtype=dtype)
+
+    def __getstate__(self):
+        return {"_data": self.values.copy(), "_n": self._n}
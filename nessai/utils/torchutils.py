@@ -2,6 +2,7 @@
 """
 Utilities for configuring torch.
 """
+import inspect
 import logging
 
 import torch
@@ -41,3 +42,28 @@ def set_torch_default_dtype(dtype) -> torch.dtype:
     logger.info(f"Setting torch dtype to {dtype}")
     torch.set_default_dtype(dtype)
     return dtype
+
+
+def load_state_dict(filename):
+    """Load a state dictionary that was saved with :code:`torch.save`.
+
+    The tensors are loaded on the CPU. If supported by the installed version
+    of torch, the file is memory-mapped and only tensors are unpickled.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the file.
+
+    Returns
+    -------
+    dict
+        The state dictionary.
+    """
+    kwargs = dict(map_location="cpu")
+    parameters = inspect.signature(torch.load).parameters
+    if "mmap" in parameters:
+        kwargs["mmap"] = True
+    if "weights_only" in parameters:
+        kwargs["weights_only"] = True
+    return torch.load(filename, **kwargs)
@@ -2,13 +2,15 @@
 """
 Test the object that handles the nested sampling evidence and prior volumes.
 """
-from unittest.mock import create_autospec, patch
+from unittest.mock import call, create_autospec, patch
 import numpy as np
 import pytest
 
 from nessai.evidence import (
     _BaseNSIntegralState,
     _NSIntegralState,
+    _increment_kernel,
+    _log1pexp,
     logsubexp,
 )
 
@@ -86,21 +88,141 @@ def test_increment(nlive, expectation):
     np.testing.assert_equal(state.logLs, [-np.inf, -10])
 
 
-def test_increment_monotonic_warning(ns_state, caplog):
+@pytest.mark.parametrize("x", [-np.inf, -800.0, -1.0, 0.0, 2.0, 800.0, np.inf])
+def test_log1pexp(x):
+    """Assert the scalar function matches numpy"""
+    np.testing.assert_allclose(_log1pexp(x), np.logaddexp(0, x))
+
+
+def test_increment_kernel():
+    """Assert the scalar kernel matches the equivalent numpy expressions"""
+    logL, logw, logZ, info = -5.0, -0.5, -8.0, 0.1
+    logt = -0.02
+    log_shrink = np.log1p(-np.exp(logt))
+    wt = logw + logL + log_shrink
+    logZ_expected = np.logaddexp(logZ, wt)
+    info_expected = (
+        np.exp(wt - logZ_expected) * logL
+        + np.exp(logZ - logZ_expected) * (info + logZ)
+        - logZ_expected
+    )
+    out = _increment_kernel(logL, logw, logZ, info, logt, log_shrink)
+    np.testing.assert_allclose(
+        out, [logZ_expected, logw + logt, info_expected]
+    )
+
+
+def test_increment_kernel_no_info():
+    """Assert the information is NaN if the evidence is not finite"""
+    logt = -0.1
+    out = _increment_kernel(
+        -5.0, 0.0, -np.inf, 0.0, logt, np.log1p(-np.exp(logt))
+    )
+    assert np.isfinite(out[0])
+    assert np.isnan(out[2])
+
+
+@pytest.mark.parametrize(
+    "expectation, value", [("logt", -1 / 50), ("t", -np.log1p(1 / 50))]
+)
+def test_shrinkage(expectation, value):
+    """Assert the cached shrinkage matches the expected values"""
+    state = _NSIntegralState(50, expectation=expectation)
+    assert state._logt == value
+    assert state._log_shrink == np.log1p(-np.exp(value))
+    assert type(state._logt) is float
+    assert type(state._log_shrink) is float
+    logt, log_shrink = state._shrinkage(np.array([50, 50]))
+    np.testing.assert_array_equal(logt, [value, value])
+    np.testing.assert_array_equal(log_shrink, [state._log_shrink] * 2)
+
+
+@pytest.mark.parametrize("expectation", ["logt", "t"])
+def test_increment_batch(nlive, expectation):
+    """Assert the batch increment is equivalent to repeated increments"""
+    logL = np.linspace(-10, 0, 20)
+    nlive_seq = np.arange(len(logL), 0, -1)
+    state = _NSIntegralState(nlive, expectation=expectation)
+    expected = _NSIntegralState(nlive, expectation=expectation)
+    for s in [state, expected]:
+        s.increment(-20.0)
+    for v, n in zip(logL, nlive_seq):
+        expected.increment(v, nlive=n)
+    state.increment_batch(logL, nlive=nlive_seq)
+    for attr in ["logLs", "log_vols", "info", "gradients", "nlive"]:
+        np.testing.assert_allclose(
+            getattr(state, attr), getattr(expected, attr)
+        )
+    np.testing.assert_allclose(state.logZ, expected.logZ)
+    # The prior volumes must match exactly so the posterior weights match
+    # those computed from the nested samples
+    np.testing.assert_array_equal(state.log_vols, expected.log_vols)
+    assert state.logw == expected.logw
+
+
+def test_increment_batch_fallback(nlive):
+    """Assert increment is used if the evidence is not yet finite"""
+    state = _NSIntegralState(nlive)
+    with patch.object(state, "increment") as mock_increment:
+        state.increment_batch([-1.0, 0.0], nlive=[2, 1])
+    mock_increment.assert_has_calls([call(-1.0, nlive=2), call(0.0, nlive=1)])
+
+
+def test_increment_monotonic_warning(nlive, caplog):
     """Assert a warning is raised if the likelihood is non-monotonic"""
-    ns_state.logLs = [1, 2, 3]
-    ns_state.base_nlive = 10
-    ns_state.nlive = 3 * [10]
-    ns_state.logZ = -2.0
-    ns_state.logw = 1.0
-    ns_state.info = [0]
-    ns_state.log_vols = []
-    ns_state.track_gradients = False
-    ns_state.expectation = "logt"
-    _NSIntegralState.increment(ns_state, 2.5)
+    state = _NSIntegralState(nlive)
+    state.increment(3.0)
+    state.increment(2.5)
     assert "received non-monotonic logL" in str(caplog.text)
 
 
+def test_increment_grow(nlive):
+    """Assert the arrays grow when the initial capacity is exceeded"""
+    state = _NSIntegralState(nlive)
+    capacity = state._capacity
+    logL = np.linspace(-10, 0, capacity + 10)
+    for v in logL:
+        state.increment(v)
+    assert state._capacity == 2 * capacity
+    np.testing.assert_array_equal(state.logLs[1:], logL)
+    assert len(state.log_vols) == len(logL) + 1
+    assert len(state.nlive) == len(logL)
+    assert len(state.gradients) == len(logL) + 1
+
+
+def test_setstate_list_history(nlive):
+    """Assert a state pickled with the history stored in lists is converted
+    to the preallocated arrays.
+    """
+    expected = _NSIntegralState(nlive)
+    for v in [-10.0, -5.0, -2.0]:
+        expected.increment(v)
+    old = {
+        "base_nlive": nlive,
+        "track_gradients": True,
+        "expectation": "logt",
+        "logZ": expected.logZ,
+        "oldZ": -np.inf,
+        "logw": expected.logw,
+        "info": expected.info.tolist(),
+        "logLs": expected.logLs.tolist(),
+        "log_vols": expected.log_vols.tolist(),
+        "nlive": expected.nlive.tolist(),
+        "gradients": expected.gradients.tolist(),
+    }
+    state = _NSIntegralState.__new__(_NSIntegralState)
+    state.__setstate__(old)
+    np.testing.assert_array_equal(state.logLs, expected.logLs)
+    np.testing.assert_array_equal(state.log_vols, expected.log_vols)
+    np.testing.assert_array_equal(state.info, expected.info)
+    np.testing.assert_array_equal(state.nlive, expected.nlive)
+    assert state._logt == expected._logt
+    state.increment(-1.0)
+    expected.increment(-1.0)
+    assert state.logZ == expected.logZ
+    np.testing.assert_array_equal(state.logLs, expected.logLs)
+
+
 def test_log_evidence(ns_state):
     """Assert the log-evidence property returns the correct value"""
     expected = 1.0
@@ -147,6 +269,15 @@ def test_track_gradients(nlive):
     assert len(state.gradients) == 1
 
 
+def test_gradients(nlive):
+    """Assert the gradients are computed from the history"""
+    state = _NSIntegralState(nlive)
+    state.increment(-10)
+    state.increment(-5)
+    expected = [0.0, -np.inf, 5.0 / (state.log_vols[2] - state.log_vols[1])]
+    np.testing.assert_array_equal(state.gradients, expected)
+
+
 @pytest.mark.parametrize(
     "expectation, value", [("logt", -1 / 50), ("t", -np.log1p(1 / 50))]
 )
@@ -179,21 +310,22 @@ def test_plot_w_filename(nlive, tmpdir):
     assert fig is None
 
 
-def test_log_posterior_weights(ns_state):
+def test_log_posterior_weights(nlive):
     """Test the log-posterior weights property"""
-    log_vols = [0.0, -0.1, -0.2, -0.3]
-    logL = [np.NINF, -10.0, -5.0, -0.0]
-    ns_state.log_vols = log_vols
-    ns_state.logLs = logL
+    logL = [-10.0, -5.0, -0.0]
+    state = _NSIntegralState(nlive)
+    for v in logL:
+        state.increment(v)
+    log_vols = state.log_vols.copy()
     log_z = -1.0
     with patch(
         "nessai.evidence.log_integrate_log_trap", return_value=log_z
     ) as mock_int:
-        out = _NSIntegralState.log_posterior_weights.__get__(ns_state)
+        out = _NSIntegralState.log_posterior_weights.__get__(state)
 
     trap_inputs = mock_int.call_args[0]
-    np.testing.assert_array_equal(trap_inputs[0], logL + [-0.0])
-    np.testing.assert_array_equal(trap_inputs[1], log_vols + [np.NINF])
+    np.testing.assert_array_equal(trap_inputs[0], [np.NINF] + logL + [-0.0])
+    np.testing.assert_array_equal(trap_inputs[1], np.append(log_vols, np.NINF))
     # Output should one shorted than logL since the initial point is not a
     # nested sample.
-    assert len(out) == (len(logL) - 1)
+    assert len(out) == len(logL)
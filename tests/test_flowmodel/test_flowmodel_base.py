@@ -464,7 +464,9 @@ def test_load_weights(model, initialised):
     model.model.load_state_dict = MagicMock()
     model.model.eval = MagicMock()
     d = dict(weight=torch.tensor(1))
-    with patch("torch.load", return_value=d) as mock_load:
+    with patch(
+        "nessai.flowmodel.base.load_state_dict", return_value=d
+    ) as mock_load:
         FlowModel.load_weights(model, weights_file)
     # Shouldn't initialise twice
     if initialised:
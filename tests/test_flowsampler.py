@@ -605,9 +605,9 @@ def test_signal_handling(tmp_path, caplog, model, kwargs, mp_context):
     output = tmp_path / "output"
     output.mkdir()
 
-    with patch("multiprocessing.Pool", mp_context.Pool), patch(
-        "nessai.utils.multiprocessing.multiprocessing.get_start_method",
-        mp_context.get_start_method,
+    with patch(
+        "nessai.utils.multiprocessing.get_multiprocessing_context",
+        return_value=mp_context,
     ):
         fs = FlowSampler(
             model,
@@ -1,5 +1,6 @@
 """Tests for livepoint functions"""
 import sys
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -167,6 +168,14 @@ def test_get_dtype_change_dtype(change_dtype):
     assert dtype.fields["x"][0] == np.dtype(change_dtype)
 
 
+def test_get_dtype_updates_extra_parameters():
+    """Assert the cached dtype includes extra parameters added later"""
+    dtype = lp.get_dtype(["x"])
+    assert "logU" not in dtype.names
+    lp.add_extra_parameters_to_live_points(["logU"])
+    assert "logU" in lp.get_dtype(["x"]).names
+
+
 def test_empty_structured_array_names(non_sampling_parameters):
     """Assert the correct default values are used when specifying names"""
     n = 10
@@ -231,6 +240,29 @@ def test_empty_structured_array_change_dtype(change_dtype):
     assert array.dtype.fields["x"][0] == np.dtype(change_dtype)
 
 
+def test_copy_structured_array(live_points):
+    """Assert the copy is equal and does not share memory"""
+    out = lp.copy_structured_array(live_points)
+    assert_structured_arrays_equal(out, live_points)
+    assert not np.shares_memory(out, live_points)
+
+
+def test_copy_structured_array_out(live_points):
+    """Assert the array is copied into out"""
+    buffer = np.empty(4, dtype=live_points.dtype)
+    out = lp.copy_structured_array(live_points, out=buffer[:2])
+    assert np.shares_memory(out, buffer)
+    assert_structured_arrays_equal(buffer[:2], live_points)
+
+
+def test_copy_structured_array_not_contiguous(live_points):
+    """Assert non-contiguous arrays are copied correctly"""
+    x = np.concatenate([live_points, live_points])[::2]
+    out = lp.copy_structured_array(x)
+    assert out.flags.c_contiguous
+    assert_structured_arrays_equal(out, x)
+
+
 def test_parameters_to_live_point(live_point, non_sampling_parameters):
     """
     Test function that produces a single live point given the parameter
@@ -290,6 +322,16 @@ def test_numpy_array_multiple_to_live_points(
     )
 
 
+@pytest.mark.parametrize("names", [["x"], ["x", "y"]])
+def test_numpy_array_to_live_points_extra_columns(names):
+    """Assert only the leading columns are used if there are extra columns"""
+    array = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    x = lp.numpy_array_to_live_points(array, names=names)
+    for i, n in enumerate(names):
+        np.testing.assert_array_equal(x[n], array[:, i])
+    np.testing.assert_array_equal(x["it"], config.livepoints.it_default)
+
+
 def test_empty_numpy_array_to_live_points(empty_live_point):
     """
     Test the function the produces an array of live points given an empty
@@ -431,6 +473,15 @@ def test_multiple_live_points_to_dict(live_points):
     np.testing.assert_array_equal(list(d.values()), list(d_out.values()))
 
 
+def test_live_points_to_dict_copy(live_points):
+    """Assert the fields are contiguous copies if copy=True"""
+    d_out = lp.live_points_to_dict(live_points, copy=True)
+    for k, v in d_out.items():
+        assert v.flags.c_contiguous
+        assert not np.shares_memory(v, live_points)
+        np.testing.assert_array_equal(v, live_points[k])
+
+
 def test_unstructured_view_dtype(live_points):
     """Assert the correct array is returned when given the dtype"""
     dtype = np.dtype({n: live_points.dtype.fields[n] for n in ["x", "y"]})
@@ -446,6 +497,18 @@ def test_unstructured_view_names(live_points):
     assert view.shape == (live_points.size, 2)
 
 
+def test_unstructured_view_single_parameter(live_points):
+    """Assert the view for a single parameter is one-dimensional and does not
+    raise numpy's deprecation warning for (type, 1).
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        view = lp.unstructured_view(live_points, names=["x"])
+    assert view.base is live_points
+    assert view.shape == (live_points.size,)
+    np.testing.assert_array_equal(view, live_points["x"])
+
+
 def test_unstructured_view_error(live_points):
     """Assert an error is raised when neither names or dtype is given."""
     with pytest.raises(TypeError):
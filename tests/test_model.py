@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, call, create_autospec, patch
 from nessai.livepoint import numpy_array_to_live_points
 from nessai.model import Model, OneDimensionalModelError
 from nessai.utils.multiprocessing import (
+    batch_log_likelihood_wrapper,
     initialise_pool_variables,
     log_likelihood_wrapper,
 )
@@ -868,14 +869,17 @@ def test_configure_pool_n_pool(model):
     """Test configuring the pool when n_pool is specified"""
     n_pool = 1
     pool = MagicMock()
-    with patch("multiprocessing.Pool", return_value=pool) as mock_pool, patch(
-        "nessai.utils.multiprocessing.check_multiprocessing_start_method"
-    ) as mock_check:
+    context = MagicMock()
+    context.Pool = MagicMock(return_value=pool)
+    with patch(
+        "nessai.utils.multiprocessing.get_multiprocessing_context",
+        return_value=context,
+    ) as mock_context:
         Model.configure_pool(model, n_pool=n_pool)
     assert model.pool is pool
 
-    mock_check.assert_called_once()
-    mock_pool.assert_called_once_with(
+    mock_context.assert_called_once()
+    context.Pool.assert_called_once_with(
         processes=n_pool,
         initializer=initialise_pool_variables,
         initargs=(model,),
@@ -958,16 +962,59 @@ def test_evaluate_likelihoods_pool_vectorised(model, chunksize):
     np.testing.assert_array_equal(out, expected)
 
 
-@pytest.mark.parametrize("chunksize", [None, 1])
-def test_evaluate_likelihoods_pool_not_vectorised(model, chunksize):
-    """Test evaluating the likelihood with a pool"""
+@pytest.mark.parametrize(
+    "chunksize, n_pool, n, n_chunks",
+    [
+        (None, 2, 2, 2),
+        (None, 2, 20, 8),
+        (1, 2, 2, 2),
+        (1, 2, 20, 20),
+        (3, 2, 20, 7),
+        (3, None, 20, 7),
+    ],
+)
+def test_evaluate_likelihoods_pool_not_vectorised(
+    model, chunksize, n_pool, n, n_chunks
+):
+    """Test evaluating the likelihood with a pool.
+
+    Samples should be sent to the pool in chunks. If the chunksize is
+    specified, it should determine the size of the chunks.
+    """
+    samples = numpy_array_to_live_points(np.arange(n)[:, np.newaxis], ["x"])
+    logL = np.arange(n, dtype=float)
+    model.pool = MagicMock(side_effect=True)
+    model.n_pool = n_pool
+    model.vectorised_likelihood = False
+    model.allow_vectorised = True
+    model.likelihood_chunksize = chunksize
+    model.pool.map = MagicMock(
+        side_effect=lambda f, chunks: [c["x"].astype(float) for c in chunks]
+    )
+    model.likelihood_evaluation_time = datetime.timedelta()
+    model.likelihood_evaluations = 100
+    out = Model.batch_evaluate_log_likelihood(model, samples)
+    model.pool.map.assert_called_once()
+    func, chunks = model.pool.map.call_args[0]
+    assert func is batch_log_likelihood_wrapper
+    assert len(chunks) == n_chunks
+    assert_structured_arrays_equal(np.concatenate(chunks), samples)
+    model.likelihood_evaluation_time.total_seconds() > 0
+    assert model.likelihood_evaluations == 100 + n
+    np.testing.assert_array_equal(out, logL)
+
+
+def test_evaluate_likelihoods_pool_not_vectorised_unknown_n_pool(model):
+    """Assert samples are sent individually if the number of processes and
+    the chunksize are not known.
+    """
     samples = numpy_array_to_live_points(np.array([[1], [2]]), ["x"])
     logL = np.array([3, 4])
     model.pool = MagicMock(side_effect=True)
-    model.n_pool = 2
+    model.n_pool = None
     model.vectorised_likelihood = False
     model.allow_vectorised = True
-    model.likelihood_chunksize = chunksize
+    model.likelihood_chunksize = None
     model.pool.map = MagicMock(return_value=logL)
     model.likelihood_evaluation_time = datetime.timedelta()
     model.likelihood_evaluations = 100
@@ -1062,11 +1109,15 @@ def test_evaluate_likelihoods_pool_allow_vectorised_false(model):
     model.n_pool = 2
     model.vectorised_likelihood = True
     model.allow_vectorised = False
-    model.pool.map = MagicMock(return_value=logL)
+    model.likelihood_chunksize = None
+    model.pool.map = MagicMock(return_value=[logL])
     model.likelihood_evaluation_time = datetime.timedelta()
     model.likelihood_evaluations = 100
     out = Model.batch_evaluate_log_likelihood(model, samples)
-    model.pool.map.assert_called_once_with(log_likelihood_wrapper, samples)
+    model.pool.map.assert_called_once()
+    func, chunks = model.pool.map.call_args[0]
+    assert func is batch_log_likelihood_wrapper
+    assert_structured_arrays_equal(np.concatenate(chunks), samples)
     model.likelihood_evaluation_time.total_seconds() > 0
     assert model.likelihood_evaluations == 102
     np.testing.assert_array_equal(out, logL)
@@ -1171,9 +1222,9 @@ def test_n_pool(integration_model, mp_context):
     """Integration test for evaluating the likelihood with n_pool"""
     # Cannot pickle lambda functions
     integration_model.fn = lambda x: x
-    with patch("multiprocessing.Pool", mp_context.Pool), patch(
-        "nessai.utils.multiprocessing.multiprocessing.get_start_method",
-        mp_context.get_start_method,
+    with patch(
+        "nessai.utils.multiprocessing.get_multiprocessing_context",
+        return_value=mp_context,
     ):
         integration_model.configure_pool(n_pool=1)
     assert integration_model.n_pool == 1
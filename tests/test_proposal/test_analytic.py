@@ -25,6 +25,11 @@ def test_init(proposal):
     assert proposal.populated is False
 
 
+def test_draw_mutates_input():
+    """Assert the proposal does not modify the old point"""
+    assert AnalyticProposal.draw_mutates_input is False
+
+
 def test_poolsize(proposal):
     """Test poolsize property"""
     proposal._poolsize = 100
@@ -68,43 +73,140 @@ def test_populate(proposal, N):
     np.testing.assert_array_equal(proposal.samples["logL"], log_l)
 
 
+def test_draw(proposal):
+    """Assert draw returns a single sample from the pool"""
+    proposal._draw_from_pool = MagicMock(return_value=np.array([4]))
+
+    sample = AnalyticProposal.draw(proposal, 1, N=5)
+
+    assert sample == 4
+    proposal._draw_from_pool.assert_called_once_with(1, 1, N=5)
+
+
 @pytest.mark.parametrize("populated", [True, False])
-def test_draw(proposal, populated, wait):
-    """Test the draw method"""
-    N = 5
+def test_draw_from_pool(proposal, populated, wait):
+    """Test drawing from the pool and populating it if needed"""
     proposal.populated = populated
     proposal.populate = Mock(side_effect=wait)
     proposal.population_time = datetime.timedelta()
-    proposal.indices = [0, 1, 2, 3, 4]
-    proposal.samples = np.array([0, 1, 2, 3, 4])
+    proposal._take_from_pool = MagicMock(return_value=np.array([4, 3]))
 
-    sample = AnalyticProposal.draw(proposal, 1, N=N)
-
-    assert sample == 4
+    samples = AnalyticProposal._draw_from_pool(proposal, 1, 2, N=5)
 
+    np.testing.assert_array_equal(samples, [4, 3])
+    proposal._take_from_pool.assert_called_once_with(2)
     if not populated:
-        proposal.populate.assert_called_once_with(N=N)
+        proposal.populate.assert_called_once_with(N=5)
         assert proposal.population_time.total_seconds() > 0.0
     else:
         proposal.populate.assert_not_called()
         assert proposal.population_time.total_seconds() == 0.0
-    assert proposal.indices == [0, 1, 2, 3]
 
 
-def test_draw_out_of_samples(proposal):
-    """Assert populated is set to false when the last sample is used."""
-    N = 5
+def test_draw_batch():
+    """Assert draw batch draws from the pool"""
+    proposal = AnalyticProposal.__new__(AnalyticProposal)
+    proposal._draw_from_pool = MagicMock(return_value=np.array([4, 3]))
+
+    samples = proposal.draw_batch(1, N=2, N_pool=5)
+
+    np.testing.assert_array_equal(samples, [4, 3])
+    proposal._draw_from_pool.assert_called_once_with(1, 2, N_pool=5)
+
+
+def test_draw_batch_draw_overridden():
+    """Assert draw is used if it is overridden by a subclass"""
+
+    class TestProposal(AnalyticProposal):
+        def draw(self, old_sample):
+            return np.array(7)
+
+    proposal = TestProposal.__new__(TestProposal)
+    proposal._draw_from_pool = MagicMock()
+
+    samples = proposal.draw_batch(1, N=4)
+
+    np.testing.assert_array_equal(samples, [7])
+    proposal._draw_from_pool.assert_not_called()
+
+
+@pytest.mark.parametrize("N", [0, -1])
+def test_draw_batch_invalid_N(N):
+    """Assert an error is raised and the pool is unchanged if N < 1"""
+    proposal = AnalyticProposal.__new__(AnalyticProposal)
+    proposal._draw_from_pool = MagicMock()
+    with pytest.raises(ValueError, match=r"N must be at least 1"):
+        proposal.draw_batch(1, N=N)
+    proposal._draw_from_pool.assert_not_called()
+
+
+def test_take_from_pool(proposal):
+    """Assert samples are taken in the same order as pop"""
     proposal.populated = True
-    proposal.indices = [0]
-    proposal.samples = np.array([0, 1, 2, 3, 4])
+    proposal.indices = [0, 1, 2, 3, 4]
+    proposal.samples = np.array([10, 11, 12, 13, 14])
+
+    samples = AnalyticProposal._take_from_pool(proposal, 2)
+
+    np.testing.assert_array_equal(samples, [14, 13])
+    assert proposal.indices == [0, 1, 2]
+    assert proposal._batch_indices == [4, 3]
+    assert proposal.populated is True
+
+
+def test_take_from_pool_empty(proposal):
+    """Assert populated is set to false if the pool is emptied"""
+    proposal.populated = True
+    proposal.indices = [0, 1]
+    proposal.samples = np.array([10, 11, 12, 13, 14])
 
-    sample = AnalyticProposal.draw(proposal, 1, N=N)
+    samples = AnalyticProposal._take_from_pool(proposal, 5)
 
-    assert sample == 0
+    np.testing.assert_array_equal(samples, [11, 10])
     assert proposal.indices == []
     assert proposal.populated is False
 
 
+@pytest.mark.parametrize("n", [0, 2])
+def test_return_samples(proposal, n):
+    """Assert unused samples are returned to the pool in order and their
+    log-likelihoods are stored.
+    """
+    proposal.populated = False
+    proposal.indices = [0]
+    proposal._batch_indices = [4, 3, 2, 1]
+    proposal.samples = np.zeros(5, dtype=[("x", "f8"), ("logL", "f8")])
+    samples = np.zeros(4, dtype=proposal.samples.dtype)
+    samples["logL"] = [1.0, 2.0, 3.0, 4.0]
+
+    AnalyticProposal.return_samples(proposal, samples[4 - n :])
+
+    if n:
+        assert proposal.indices == [0, 1, 2]
+        assert proposal.populated is True
+        np.testing.assert_array_equal(
+            proposal.samples["logL"], [0.0, 4.0, 3.0, 0.0, 0.0]
+        )
+    else:
+        assert proposal.indices == [0]
+        assert proposal.populated is False
+        np.testing.assert_array_equal(proposal.samples["logL"], 0.0)
+
+
+@pytest.mark.integration_test
+def test_draw_batch_integration(model):
+    """Integration test for drawing and returning batches"""
+    proposal = AnalyticProposal(model, poolsize=10)
+    old_point = model.new_point()
+    samples = proposal.draw_batch(old_point, N=4)
+    assert samples.size == 4
+    proposal.return_samples(samples[2:])
+    assert len(proposal.indices) == 8
+    samples = proposal.draw_batch(old_point, N=20)
+    assert samples.size == 8
+    assert not proposal.populated
+
+
 @pytest.mark.integration_test
 def test_draw_intergration(model):
     """Integration test for the draw method"""
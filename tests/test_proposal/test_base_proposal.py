@@ -80,6 +80,34 @@ def test_draw(proposal):
         Proposal.draw(proposal, None)
 
 
+@pytest.mark.parametrize("mutates", [False, True])
+def test_draw_batch(proposal, mutates):
+    """Assert the default draw batch draws a single point and only copies
+    the old point if the draw method may modify it.
+    """
+    x = numpy_array_to_live_points(np.array([[1.0]]), ["x"])[0]
+    old = numpy_array_to_live_points(np.array([[0.0]]), ["x"])[0]
+    proposal.draw = MagicMock(return_value=x)
+    proposal.draw_mutates_input = mutates
+    out = Proposal.draw_batch(proposal, old, N=10)
+    proposal.draw.assert_called_once()
+    assert proposal.draw.call_args[0][0]["x"] == old["x"]
+    assert (proposal.draw.call_args[0][0] is old) is not mutates
+    assert out.shape == (1,)
+    assert out[0]["x"] == x["x"]
+
+
+def test_return_samples(proposal):
+    """Assert returning no samples does not raise an error"""
+    Proposal.return_samples(proposal, np.array([]))
+
+
+def test_return_samples_error(proposal):
+    """Assert an error is raised if samples are returned"""
+    with pytest.raises(RuntimeError, match="cannot return unused samples"):
+        Proposal.return_samples(proposal, np.array([1.0]))
+
+
 def test_test_draw(proposal):
     """Test the test draw method"""
     proposal.model = Mock()
@@ -142,3 +170,8 @@ def test_pickling(model):
     d = pickle.dumps(proposal)
     out = pickle.loads(d)
     assert hasattr(out, "model") is False
+
+
+def test_draw_mutates_input_default():
+    """Assert the base proposal assumes draw may modify the old point"""
+    assert Proposal.draw_mutates_input is True
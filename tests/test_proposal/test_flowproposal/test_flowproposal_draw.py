@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 """Tests related to drawing new points from the pool."""
+import datetime
+
 import numpy as np
 import pytest
 from unittest.mock import MagicMock, Mock
@@ -8,62 +10,82 @@ from nessai.livepoint import dict_to_live_points
 from nessai.proposal import FlowProposal
 
 
-def test_draw_populated(proposal):
-    """Test the draw method if the proposal is already populated"""
-    proposal.populated = True
-    proposal.samples = np.arange(3)
-    proposal.indices = list(range(3))
-    out = FlowProposal.draw(proposal, None)
-    assert out == proposal.samples[2]
-    assert proposal.indices == [0, 1]
+def test_draw(proposal):
+    """Assert draw returns a single point from the pool"""
+    proposal._draw_from_pool = MagicMock(return_value=np.array([2]))
+    out = FlowProposal.draw(proposal, 1.0)
+    assert out == 2
+    proposal._draw_from_pool.assert_called_once_with(1.0, 1)
 
 
-def test_draw_populated_last_sample(proposal):
-    """Test the draw method if the proposal is already populated but there
-    is only one sample left.
-    """
+def test_draw_from_pool_populated(proposal):
+    """Test drawing from the pool if the proposal is already populated"""
     proposal.populated = True
-    proposal.samples = np.arange(3)
-    proposal.indices = [0]
-    out = FlowProposal.draw(proposal, None)
-    assert out == proposal.samples[0]
-    assert proposal.indices == []
-    assert proposal.populated is False
+    proposal._take_from_pool = MagicMock(return_value=np.array([2, 1]))
+    out = FlowProposal._draw_from_pool(proposal, None, 2)
+    np.testing.assert_array_equal(out, [2, 1])
+    proposal._take_from_pool.assert_called_once_with(2)
+    proposal.populate.assert_not_called()
 
 
 @pytest.mark.parametrize("update", [False, True])
-def test_draw_not_populated(proposal, update, wait):
-    """Test the draw method when the proposal is not populated"""
-    import datetime
-
+def test_draw_from_pool_not_populated(proposal, update, wait):
+    """Test drawing from the pool when the proposal is not populated"""
     proposal.populated = False
     proposal.poolsize = 100
     proposal.population_time = datetime.timedelta()
-    proposal.samples = None
-    proposal.indices = []
     proposal.update_poolsize = update
     proposal.update_poolsize_scale = MagicMock()
     proposal.ns_acceptance = 0.5
+    proposal._take_from_pool = MagicMock(return_value=np.array([2, 1]))
 
     def mock_populate(*args, **kwargs):
         wait()
         proposal.populated = True
-        proposal.samples = np.arange(3)
-        proposal.indices = list(range(3))
 
     proposal.populate = MagicMock(side_effect=mock_populate)
 
-    out = FlowProposal.draw(proposal, 1.0)
+    out = FlowProposal._draw_from_pool(proposal, 1.0, 2)
 
-    assert out == 2
-    assert proposal.populated is True
+    np.testing.assert_array_equal(out, [2, 1])
     assert proposal.population_time.total_seconds() > 0.0
-
     proposal.populate.assert_called_once_with(1.0, N=100)
-
     assert proposal.update_poolsize_scale.called == update
 
 
+def test_draw_batch():
+    """Assert draw batch draws from the pool"""
+    proposal = FlowProposal.__new__(FlowProposal)
+    proposal._draw_from_pool = MagicMock(return_value=np.array([2, 1]))
+    out = proposal.draw_batch(1.0, N=2)
+    np.testing.assert_array_equal(out, [2, 1])
+    proposal._draw_from_pool.assert_called_once_with(1.0, 2)
+
+
+def test_draw_batch_draw_overridden():
+    """Assert draw is used if it is overridden by a subclass"""
+
+    class TestProposal(FlowProposal):
+        def draw(self, worst_point):
+            return np.array(7)
+
+    proposal = TestProposal.__new__(TestProposal)
+    proposal._draw_from_pool = MagicMock()
+    out = proposal.draw_batch(1.0, N=4)
+    np.testing.assert_array_equal(out, [7])
+    proposal._draw_from_pool.assert_not_called()
+
+
+@pytest.mark.parametrize("N", [0, -1])
+def test_draw_batch_invalid_N(N):
+    """Assert an error is raised if N < 1"""
+    proposal = FlowProposal.__new__(FlowProposal)
+    proposal._draw_from_pool = MagicMock()
+    with pytest.raises(ValueError, match=r"N must be at least 1"):
+        proposal.draw_batch(None, N=N)
+    proposal._draw_from_pool.assert_not_called()
+
+
 def test_test_draw(proposal):
     """
     Test the method that tests the draw and populate methods when running.
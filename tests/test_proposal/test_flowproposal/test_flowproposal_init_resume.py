@@ -213,8 +213,10 @@ def test_reset(proposal):
     proposal.samples = 2
     proposal.populated = True
     proposal.populated_count = 10
+    proposal._batch_indices = [1, 2]
     FlowProposal.reset(proposal)
     assert proposal.x is None
+    assert proposal._batch_indices == []
     assert proposal.samples is None
     assert proposal.populated is False
     assert proposal.populated_count == 0
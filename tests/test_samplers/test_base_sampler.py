@@ -2,12 +2,12 @@
 """Test the base nested sampler"""
 import datetime
 import os
-import pickle
 import pytest
 import time
 from unittest.mock import MagicMock, create_autospec, patch
 
 from nessai.samplers.base import BaseNestedSampler
+from nessai.utils import checkpointing
 
 
 @pytest.fixture
@@ -279,7 +279,7 @@ def test_checkpoint_iteration(sampler, wait, periodic):
         BaseNestedSampler.checkpoint(sampler, periodic=periodic)
 
     sfd_mock.assert_called_once_with(
-        sampler, sampler.resume_file, pickle, save_existing=True
+        sampler, sampler.resume_file, checkpointing, save_existing=True
     )
 
     assert sampler.sampling_start_time > now
@@ -318,7 +318,7 @@ def test_checkpoint_time(sampler, wait):
         BaseNestedSampler.checkpoint(sampler, periodic=True)
 
     sfd_mock.assert_called_once_with(
-        sampler, sampler.resume_file, pickle, save_existing=True
+        sampler, sampler.resume_file, checkpointing, save_existing=True
     )
     assert sampler._last_checkpoint is now
 
@@ -354,7 +354,7 @@ def test_checkpoint_force(sampler):
     with patch("nessai.samplers.base.safe_file_dump") as sfd_mock:
         BaseNestedSampler.checkpoint(sampler, periodic=True, force=True)
     sfd_mock.assert_called_once_with(
-        sampler, sampler.resume_file, pickle, save_existing=True
+        sampler, sampler.resume_file, checkpointing, save_existing=True
     )
 
 
@@ -381,12 +381,12 @@ def test_resume(model):
     model.likelihood_evaluations = 1
     model.likelihood_evaluation_time = datetime.timedelta(seconds=2)
 
-    with patch("pickle.load", return_value=obj) as mock_pickle, patch(
-        "builtins.open"
-    ):
+    with patch(
+        "nessai.utils.checkpointing.load", return_value=obj
+    ) as mock_load, patch("builtins.open"):
         out = BaseNestedSampler.resume("test.pkl", model)
 
-    mock_pickle.assert_called_once()
+    mock_load.assert_called_once()
 
     assert out.model == model
     assert out.model.likelihood_evaluations == 4
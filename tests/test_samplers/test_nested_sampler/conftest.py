@@ -8,6 +8,7 @@ from nessai.samplers.nestedsampler import NestedSampler
 def sampler(model):
     s = create_autospec(NestedSampler)
     s.nlive = 100
+    s._history_interval = 10
     s.model = model
     s.store_live_points = False
     return s
@@ -5,7 +5,7 @@ Test the main sampling functions
 import logging
 import numpy as np
 import pytest
-from unittest.mock import call, MagicMock
+from unittest.mock import MagicMock, patch
 
 from nessai.livepoint import (
     numpy_array_to_live_points,
@@ -29,12 +29,10 @@ def sampler(sampler):
     sampler.state.info = [0.0]
     sampler.state.log_evidence_error = 0.1
     sampler.nlive = 4
-    sampler.nested_samples = []
     sampler.iteration = 0
     sampler.condition = np.inf
     sampler.block_iteration = 0
     sampler.logLmax = 5
-    sampler.insertion_indices = []
     sampler.accepted = 0
     sampler.rejected = 0
     sampler.block_acceptance = 0.0
@@ -104,30 +102,36 @@ def test_log_state(sampler, caplog):
     assert "logZ:" in str(caplog.text)
 
 
+def test_log_state_disabled(sampler, caplog):
+    """Assert the state is not accessed if INFO logging is disabled"""
+    caplog.set_level(logging.WARNING)
+    sampler.state = MagicMock(spec=[])
+    NestedSampler.log_state(sampler)
+    assert caplog.text == ""
+
+
 def test_finalise(sampler, live_points):
     """Test the finalise method"""
-    sampler.live_points = live_points
+    sampler.live_points = live_points[::-1].copy()
+    sampler.sorted_live_points = live_points
     sampler.finalised = False
 
     NestedSampler.finalise(sampler)
 
-    calls = [
-        call(0, nlive=4),
-        call(1, nlive=3),
-        call(2, nlive=2),
-        call(3, nlive=1),
-    ]
-
-    sampler.state.increment.assert_has_calls(calls)
+    sampler.state.increment_batch.assert_called_once()
+    args, kwargs = sampler.state.increment_batch.call_args
+    np.testing.assert_array_equal(args[0], [0, 1, 2, 3])
+    np.testing.assert_array_equal(kwargs["nlive"], [4, 3, 2, 1])
     sampler.update_state.assert_called_once_with(force=True)
     sampler.state.finalise.assert_called_once()
-    assert_structured_arrays_equal(sampler.nested_samples, [*live_points])
+    sampler._add_nested_samples.assert_called_once_with(live_points)
     assert sampler.finalised is True
 
 
 def test_consume_sample(sampler, live_points):
     """Test the default behaviour of consume sample"""
     sampler.live_points = live_points
+    sampler._order = np.arange(4)
     new_sample = np.squeeze(parameters_to_live_point((0.5,), ["x"]))
     new_sample["logL"] = 0.5
     sampler.yield_sample = MagicMock()
@@ -135,24 +139,52 @@ def test_consume_sample(sampler, live_points):
 
     sampler.insert_live_point = MagicMock(return_value=0)
     sampler.check_state = MagicMock()
+    sampler._add_nested_samples = MagicMock(
+        side_effect=lambda x: np.atleast_1d(x).copy()
+    )
 
     NestedSampler.consume_sample(sampler)
 
     sampler.insert_live_point.assert_called_once_with(new_sample)
     sampler.check_state.assert_not_called()
 
-    assert_structured_arrays_equal(sampler.nested_samples, [live_points[0]])
+    sampler._add_nested_samples.assert_called_once()
+    assert_structured_arrays_equal(
+        sampler._add_nested_samples.call_args[0][0], live_points[0]
+    )
     assert sampler.logLmin == 0.0
     assert sampler.accepted == 1
     assert sampler.block_acceptance == 1.0
     assert sampler.acceptance_history == [1.0]
     assert sampler.mean_block_acceptance == 1.0
-    assert sampler.insertion_indices == [0]
+    sampler._add_insertion_index.assert_called_once_with(0)
+
+
+def test_consume_sample_worst_read_only(sampler, live_points):
+    """Assert the old point given to the proposal cannot be modified, since
+    it is a view of the nested samples.
+    """
+    sampler.live_points = live_points
+    sampler._order = np.arange(4)
+    buffer = live_points.copy()
+    sampler._add_nested_samples = MagicMock(return_value=buffer[:1])
+
+    def yield_sample(old_sample):
+        old_sample["x"] = 10.0
+        yield 1, old_sample
+
+    sampler.yield_sample = yield_sample
+
+    with pytest.raises(ValueError, match="read-only"):
+        NestedSampler.consume_sample(sampler)
+    assert_structured_arrays_equal(buffer, live_points)
+    assert buffer.flags.writeable
 
 
 def test_consume_sample_reject(sampler, live_points):
     """Test the default behaviour of consume sample"""
     sampler.live_points = live_points
+    sampler._order = np.arange(4)
     reject_sample = parameters_to_live_point((-0.5,), ["x"])
     reject_sample["logL"] = -0.5
     new_sample = np.squeeze(parameters_to_live_point((0.5,), ["x"]))
@@ -164,20 +196,68 @@ def test_consume_sample_reject(sampler, live_points):
 
     sampler.insert_live_point = MagicMock(return_value=0)
     sampler.check_state = MagicMock()
+    sampler._add_nested_samples = MagicMock(
+        side_effect=lambda x: np.atleast_1d(x).copy()
+    )
 
     NestedSampler.consume_sample(sampler)
 
     sampler.insert_live_point.assert_called_once_with(new_sample)
     sampler.check_state.assert_called_once()
 
-    assert_structured_arrays_equal(sampler.nested_samples, [live_points[0]])
+    sampler._add_nested_samples.assert_called_once()
+    assert_structured_arrays_equal(
+        sampler._add_nested_samples.call_args[0][0], live_points[0]
+    )
     assert sampler.logLmin == 0.0
     assert sampler.rejected == 1
     assert sampler.accepted == 1
     assert sampler.block_acceptance == 0.5
     assert sampler.acceptance_history == [0.5]
     assert sampler.mean_block_acceptance == 0.5
-    assert sampler.insertion_indices == [0]
+    sampler._add_insertion_index.assert_called_once_with(0)
+
+
+def test_nested_samples_empty(sampler):
+    """Assert an empty structured array is returned if there are no samples"""
+    sampler._nested_samples = None
+    out = NestedSampler.nested_samples.fget(sampler)
+    assert out.size == 0
+    assert "logL" in out.dtype.names
+
+
+@pytest.mark.parametrize("samples", [[], "live_points"])
+def test_nested_samples_setter(sampler, live_points, samples):
+    """Assert the setter copies the samples into the buffer"""
+    if samples == "live_points":
+        samples = live_points
+    NestedSampler.nested_samples.fset(sampler, samples)
+    assert sampler._ns_n == len(samples)
+    if len(samples):
+        assert_structured_arrays_equal(sampler._nested_samples, live_points)
+        assert sampler._nested_samples is not live_points
+    else:
+        assert sampler._nested_samples is None
+
+
+def test_add_nested_samples(sampler, live_points):
+    """Assert samples are added to the buffer and it grows when full"""
+    sampler.nlive = 1
+    sampler._nested_samples = None
+    sampler._ns_n = 0
+    NestedSampler._add_nested_samples(sampler, live_points[0])
+    assert sampler._nested_samples.size == 4096
+    assert sampler._ns_n == 1
+    samples = np.tile(live_points, 1024)
+    out = NestedSampler._add_nested_samples(sampler, samples)
+    assert sampler._nested_samples.size == 8192
+    assert sampler._ns_n == 4097
+    assert np.shares_memory(out, sampler._nested_samples)
+    assert_structured_arrays_equal(out, samples)
+    assert_structured_arrays_equal(
+        sampler._nested_samples[: sampler._ns_n],
+        np.concatenate([live_points[:1], samples]),
+    )
 
 
 @pytest.mark.parametrize(
@@ -215,7 +295,7 @@ def test_nested_sampling_loop(sampler, config):
     sampler.training_time = 0.0
     sampler.proposal_population_time = 0.0
     sampler.likelihood_calls = 1
-    sampler.nested_samples = [1, 2]
+    sampler.nested_samples = np.array([1, 2])
 
     sampler.close_pool = MagicMock()
 
@@ -287,3 +367,40 @@ def test_nested_sampling_loop_prior_sampling(sampler, close_pool):
     sampler.finalise.assert_called_once()
     assert_structured_arrays_equal(samples, sampler.nested_samples)
     assert evidence == -5.99
+
+
+def test_getstate_buffers(sampler, live_points):
+    """Assert only the filled parts of the buffers are saved"""
+    buffer = np.concatenate([live_points, live_points])
+    sampler.nested_samples = live_points
+    sampler.insertion_indices = np.array([1, 2])
+    with patch(
+        "nessai.samplers.base.BaseNestedSampler.__getstate__",
+        return_value={
+            "_nested_samples": buffer,
+            "_insertion_indices": np.array([1, 2, 0, 0]),
+        },
+    ):
+        state = NestedSampler.__getstate__(sampler)
+    assert_structured_arrays_equal(state["_nested_samples"], live_points)
+    np.testing.assert_array_equal(state["_insertion_indices"], [1, 2])
+
+
+def test_insertion_indices_setter(sampler):
+    """Assert the setter copies the indices into the buffer"""
+    NestedSampler.insertion_indices.fset(sampler, [1, 2, 3])
+    assert sampler._ii_n == 3
+    np.testing.assert_array_equal(sampler._insertion_indices, [1, 2, 3])
+    assert sampler._insertion_indices.dtype == int
+
+
+@pytest.mark.parametrize("size", [0, 2, 5])
+def test_add_insertion_index(sampler, size):
+    """Assert indices are added and the buffer grows when full"""
+    sampler._insertion_indices = np.empty(size, dtype=int)
+    sampler._ii_n = 0
+    for i in range(3):
+        NestedSampler._add_insertion_index(sampler, i)
+    assert sampler._ii_n == 3
+    np.testing.assert_array_equal(sampler._insertion_indices[:3], [0, 1, 2])
+    assert sampler._insertion_indices.size >= 3
@@ -35,9 +35,15 @@ def test_init(sampler, plot, shrinkage_expectation):
             n_pool=n_pool,
             plot=plot,
             shrinkage_expectation=shrinkage_expectation,
+            plotting_interval=30,
+            draw_batch_size=16,
         )
     assert sampler.initialised is False
     assert sampler.nlive == 100
+    assert sampler.plotting_interval == 30
+    assert sampler._last_plot_time is None
+    assert sampler.draw_batch_size == 16
+    assert sampler._history_interval == 10
     mock_state.assert_called_once_with(
         100,
         track_gradients=plot,
@@ -45,6 +51,10 @@ def test_init(sampler, plot, shrinkage_expectation):
     )
     model.verify_model.assert_called_once()
     model.configure_pool.assert_called_once_with(pool=pool, n_pool=n_pool)
+    assert sampler.min_likelihood.dtype == np.float64
+    assert sampler.dZ_history.dtype == np.float32
+    assert sampler.mean_acceptance_history.dtype == np.float32
+    assert sampler.likelihood_evaluations.dtype == int
 
 
 @pytest.mark.parametrize("plot", [False, True])
@@ -14,53 +14,120 @@ from nessai.samplers.nestedsampler import NestedSampler
 def test_insert_live_point(sampler):
     """Test inserting a live point"""
     sampler.live_points = np.arange(-5, 0, 1.0).view([("logL", "f8")])
+    sampler._sorted_logL = sampler.live_points["logL"].copy()
+    sampler._order = np.arange(5, dtype=np.int32)
     new_point = np.array(-3.5, dtype=[("logL", "f8")])
     index = NestedSampler.insert_live_point(sampler, new_point)
     assert index == 1
+    np.testing.assert_array_equal(sampler._order, [1, 0, 2, 3, 4])
+    assert sampler.live_points[0]["logL"] == -3.5
+    np.testing.assert_array_equal(
+        sampler._sorted_logL, [-4.0, -3.5, -3.0, -2.0, -1.0]
+    )
+
+
+def test_insert_live_point_unsorted(sampler):
+    """Test inserting a live point when the live points are not sorted"""
+    logL = np.array([-3.0, -5.0, -1.0, -4.0, -2.0])
+    sampler.live_points = logL.copy().view([("logL", "f8")])
+    sampler._sorted_logL = np.sort(logL)
+    sampler._order = np.argsort(logL).astype(np.int32)
+    new_point = np.array(-1.5, dtype=[("logL", "f8")])
+    index = NestedSampler.insert_live_point(sampler, new_point)
+    assert index == 3
+    np.testing.assert_array_equal(
+        sampler.live_points["logL"][sampler._order],
+        [-4.0, -3.0, -2.0, -1.5, -1.0],
+    )
+    np.testing.assert_array_equal(
+        sampler._sorted_logL, sampler.live_points["logL"][sampler._order]
+    )
+
+
+@pytest.fixture
+def populate_sampler(sampler):
+    sampler.proposal = MagicMock()
+    sampler.logLmax = -np.inf
+    sampler.model.batch_evaluate_log_likelihood = MagicMock()
+    return sampler
 
 
-def test_populate_live_points(sampler):
+def test_populate_live_points(populate_sampler):
     """Test populating the live points"""
+    sampler = populate_sampler
     samples = sampler.model.new_point(sampler.nlive)
     samples["logP"] = 0.0
-    samples["logL"] = 0.0
-    sampler.yield_sample = MagicMock(
-        return_value=iter(zip(np.ones(sampler.nlive), samples))
-    )
+    samples["logL"] = np.random.randn(sampler.nlive)
+    sampler.proposal.draw_batch = MagicMock(return_value=samples)
     NestedSampler.populate_live_points(sampler)
+    sampler.proposal.draw_batch.assert_called_once_with(None, N=sampler.nlive)
+    sampler.model.batch_evaluate_log_likelihood.assert_not_called()
     assert len(sampler.live_points) == sampler.nlive
+    assert sampler.logLmax == samples["logL"].max()
+    np.testing.assert_array_equal(sampler._order, np.arange(sampler.nlive))
+    np.testing.assert_array_equal(
+        sampler._sorted_logL, sampler.live_points["logL"][sampler._order]
+    )
+    np.testing.assert_array_equal(
+        sampler.live_points["logL"], np.sort(samples["logL"])
+    )
+
+
+def test_populate_live_points_evaluates_likelihood(populate_sampler):
+    """Test that the likelihood is evaluated in a batch for points where it
+    has not been evaluated and that points outside the prior are skipped.
+    """
+    sampler = populate_sampler
+    sampler.nlive = 4
+    samples = sampler.model.new_point(5)
+    samples["logP"] = [0.0, -np.inf, 0.0, 0.0, 0.0]
+    samples["logL"] = [1.0, 0.0, 0.0, 2.0, 0.0]
+    sampler.proposal.draw_batch = MagicMock(return_value=samples)
+    sampler.model.batch_evaluate_log_likelihood = MagicMock(
+        return_value=np.array([3.0, 4.0])
+    )
+    NestedSampler.populate_live_points(sampler)
+    sampler.model.batch_evaluate_log_likelihood.assert_called_once()
+    np.testing.assert_array_equal(
+        sampler.model.batch_evaluate_log_likelihood.call_args[0][0],
+        samples[[2, 4]],
+    )
+    np.testing.assert_array_equal(
+        sampler.live_points["logL"], [1.0, 2.0, 3.0, 4.0]
+    )
 
 
-def test_populate_live_points_nans(sampler):
+def test_populate_live_points_nans(populate_sampler):
     """Test populating the live points with NaN values"""
+    sampler = populate_sampler
     new_points = sampler.model.new_point(sampler.nlive + 1)
-    new_points["logL"] = 0.0
+    new_points["logL"] = 1.0
     new_points["logL"][4] = np.nan
     new_points["logP"] = 0.0
-    sampler.yield_sample = MagicMock(
-        return_value=iter(zip(np.ones(sampler.nlive + 1), new_points))
+    sampler.proposal.draw_batch = MagicMock(
+        side_effect=[new_points[:-1], new_points[-1:]]
     )
     NestedSampler.populate_live_points(sampler)
+    assert sampler.proposal.draw_batch.call_count == 2
+    assert sampler.proposal.draw_batch.call_args[1]["N"] == 1
     assert len(sampler.live_points) == sampler.nlive
     assert not np.isnan(sampler.live_points["logL"]).any()
 
 
-def test_populate_live_points_none_returned(sampler):
-    """Assert that if None is returned by yield sample, it is skipped"""
+def test_populate_live_points_empty_batch(populate_sampler):
+    """Assert that if an empty batch is returned, it is skipped"""
+    sampler = populate_sampler
     new_points = sampler.model.new_point(5)
-    new_points["logL"] = 0.0
+    new_points["logL"] = np.arange(1.0, 6.0)
     new_points["logP"] = 0.0
-    new_points = [
-        None,
-    ] + [*new_points]
-    sampler.yield_sample = MagicMock(
-        return_value=iter(zip(np.ones(len(new_points)), new_points))
+    sampler.proposal.draw_batch = MagicMock(
+        side_effect=[new_points[:0], new_points]
     )
     sampler.nlive = 5
     NestedSampler.populate_live_points(sampler)
     np.testing.assert_array_equal(
         sampler.live_points,
-        np.sort(new_points[1:], order="logL"),
+        np.sort(new_points, order="logL"),
     )
 
 
@@ -112,13 +179,16 @@ def test_insertion_indices_p_none(mock_fn, sampler):
     assert len(sampler.rolling_p) == 0
 
 
-@pytest.mark.parametrize("filename", [None, "file.txt"])
+@pytest.mark.parametrize("filename", [None, "file.txt", "file.npy"])
+@patch("numpy.save")
 @patch("numpy.savetxt")
 @patch(
     "nessai.samplers.nestedsampler.compute_indices_ks_test",
     return_value=(0.1, 0.5),
 )
-def test_insertion_indices_save(mock_fn, mock_save, filename, sampler):
+def test_insertion_indices_save(
+    mock_fn, mock_savetxt, mock_save, filename, sampler
+):
     """Test saving the insertion indices"""
     sampler.output = os.getcwd()
     sampler.insertion_indices = np.random.randint(
@@ -129,13 +199,43 @@ def test_insertion_indices_save(mock_fn, mock_save, filename, sampler):
         sampler, rolling=False, filename=filename
     )
 
-    if filename:
-        mock_save.assert_called_once_with(
+    if filename == "file.txt":
+        mock_savetxt.assert_called_once_with(
             os.path.join(os.getcwd(), "file.txt"),
             sampler.insertion_indices,
             newline="\n",
             delimiter=" ",
         )
+        mock_save.assert_not_called()
+    elif filename == "file.npy":
+        mock_save.assert_called_once_with(
+            os.path.join(os.getcwd(), "file.npy"),
+            sampler.insertion_indices,
+        )
+        mock_savetxt.assert_not_called()
+    else:
+        mock_save.assert_not_called()
+        mock_savetxt.assert_not_called()
+
+
+def test_insertion_indices_save_integration(sampler, tmp_path):
+    """Assert the insertion indices saved in both formats match"""
+    sampler.output = str(tmp_path)
+    sampler.insertion_indices = np.random.randint(
+        sampler.nlive, size=2 * sampler.nlive
+    )
+    NestedSampler.check_insertion_indices(
+        sampler, rolling=False, filename="indices.txt"
+    )
+    NestedSampler.check_insertion_indices(
+        sampler, rolling=False, filename="indices.npy"
+    )
+    np.testing.assert_array_equal(
+        np.loadtxt(tmp_path / "indices.txt"), sampler.insertion_indices
+    )
+    np.testing.assert_array_equal(
+        np.load(tmp_path / "indices.npy"), sampler.insertion_indices
+    )
 
 
 @patch(
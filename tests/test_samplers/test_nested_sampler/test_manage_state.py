@@ -2,7 +2,9 @@
 """
 Tests related to checking and updating the state of sampler and the history.
 """
+import datetime
 import os
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -42,6 +44,8 @@ def sampler(sampler):
     sampler.proposal.population_acceptance = 0.4
 
     sampler.mean_acceptance = 0.5
+    sampler.plotting_interval = None
+    sampler._last_plot_time = None
     sampler.mean_block_acceptance = 0.5
     sampler.block_acceptance = 0.5
     sampler.block_iteration = 5
@@ -187,6 +191,51 @@ def test_update_state_every_nlive(mock_plot, plot, sampler):
         assert not mock_plot.called
 
 
+@pytest.mark.parametrize(
+    "interval, elapsed, expected",
+    [
+        (60, None, True),
+        (60, 0, False),
+        (60, 120, True),
+        (None, 0, True),
+    ],
+)
+@patch("nessai.samplers.nestedsampler.plot_indices")
+def test_update_state_plotting_interval(
+    mock_plot, sampler, interval, elapsed, expected
+):
+    """Assert the state plot is only updated once the interval has passed"""
+    if elapsed is None:
+        last_plot = None
+    else:
+        last_plot = datetime.datetime.now() - datetime.timedelta(
+            seconds=elapsed
+        )
+    sampler.nlive = 100
+    sampler.iteration = 100
+    sampler.proposal._checked_population = True
+    sampler.check_insertion_indices = MagicMock()
+    sampler.plot = True
+    sampler.uninformed_sampling = False
+    sampler.plot_state = MagicMock()
+    sampler.plot_trace = MagicMock()
+    sampler.output = os.getcwd()
+    sampler.insertion_indices = range(2 * sampler.nlive)
+    sampler.checkpointing = False
+    sampler.plotting_interval = interval
+    sampler._last_plot_time = last_plot
+
+    NestedSampler.update_state(sampler)
+
+    mock_plot.assert_called_once()
+    assert sampler.plot_state.called is expected
+    assert sampler.plot_trace.called is expected
+    if expected:
+        assert sampler._last_plot_time is not last_plot
+    else:
+        assert sampler._last_plot_time is last_plot
+
+
 @patch("nessai.samplers.nestedsampler.plot_indices")
 def test_update_state_force(mock_plot, sampler):
     """Test the update that happens if force=True.
@@ -202,6 +251,8 @@ def test_update_state_force(mock_plot, sampler):
     sampler.output = os.getcwd()
     sampler.uninformed_sampling = False
     sampler.checkpointing = False
+    sampler.plotting_interval = 60
+    sampler._last_plot_time = datetime.datetime.now()
 
     NestedSampler.update_state(sampler, force=True)
 
@@ -243,6 +294,7 @@ def test_get_result_dictionary(sampler):
     base_result = dict(seed=1234)
 
     sampler.nlive = 1
+    sampler._history_interval = 1
     sampler.iteration = 3
     sampler.min_likelihood = [-3, -2, 1]
     sampler.max_likelihood = [1, 2, 3]
@@ -256,10 +308,12 @@ def test_get_result_dictionary(sampler):
     sampler.insertion_indices = []
     sampler.training_time = timedelta()
     sampler.proposal_population_time = timedelta()
-    sampler.nested_samples = [
-        parameters_to_live_point((1, 2), ["x", "y"]),
-        parameters_to_live_point((3, 4), ["x", "y"]),
-    ]
+    sampler.nested_samples = np.concatenate(
+        [
+            parameters_to_live_point((1, 2), ["x", "y"]),
+            parameters_to_live_point((3, 4), ["x", "y"]),
+        ]
+    )
     sampler.final_p_value = 0.5
     sampler.final_ks_statistic = 0.1
 
@@ -273,3 +327,4 @@ def test_get_result_dictionary(sampler):
 
     assert out["seed"] == 1234
     assert "history" in out
+    np.testing.assert_array_equal(out["history"]["iterations"], [0, 1, 3])
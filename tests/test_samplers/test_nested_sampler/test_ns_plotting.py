@@ -49,6 +49,7 @@ def test_plot_state(sampler, tmpdir, filename, track_gradients):
 @patch("nessai.samplers.nestedsampler.plot_trace", return_value="fig")
 def test_plot_trace(mock_plot, sampler, tmpdir, samples, filename):
     """Test the plot_trace method"""
+    samples = np.array(samples)
     sampler.nested_samples = samples
     sampler.state = MagicMock()
     sampler.state.log_vols = [1, 2, 3, 4]
@@ -2,7 +2,6 @@
 """
 Test the properties in NestedSampler
 """
-from collections import deque
 import time
 import datetime
 import numpy as np
@@ -10,6 +9,7 @@ import pytest
 from unittest.mock import MagicMock
 
 from nessai.samplers.nestedsampler import NestedSampler
+from nessai.utils.structures import RingBuffer
 
 
 @pytest.fixture()
@@ -83,11 +83,13 @@ def test_last_updated_no_training(sampler):
 
 def test_mean_acceptance(sampler):
     """Assert the mean is returned"""
-    sampler.acceptance_history = [1.0, 2.0, 3.0]
+    sampler.acceptance_history = RingBuffer(10)
+    for v in [1.0, 2.0, 3.0]:
+        sampler.acceptance_history.append(v)
     assert NestedSampler.mean_acceptance.__get__(sampler) == 2.0
 
 
 def test_mean_acceptance_empty(sampler):
     """Assert nan is returned if no points have been proposed"""
-    sampler.acceptance_history = deque(maxlen=10)
+    sampler.acceptance_history = RingBuffer(10)
     assert np.isnan(NestedSampler.mean_acceptance.__get__(sampler))
@@ -2,11 +2,18 @@
 """
 Tests related to resuming.
 """
+from collections import deque
 import os
+import pickle
+
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 
-from nessai.samplers.nestedsampler import NestedSampler
+from nessai.samplers.nestedsampler import (
+    DEFAULT_DRAW_BATCH_SIZE,
+    NestedSampler,
+)
 
 
 @pytest.fixture
@@ -114,3 +121,61 @@ def test_checkpoint_resume_integration(complete_sampler, model):
     assert os.path.exists(resume_file)
     ns = NestedSampler.resume(resume_file, model)
     assert ns is not None
+
+
+@pytest.mark.integration_test
+def test_resume_old_format_integration(complete_sampler, model, tmp_path):
+    """Assert a resume file written before the history was stored in typed
+    buffers can be resumed.
+    """
+    ns = complete_sampler
+    live_points = ns.live_points[ns._order]
+    state = NestedSampler.__getstate__(ns)
+    for name in [
+        "_history_interval",
+        "draw_batch_size",
+        "plotting_interval",
+        "_last_plot_time",
+        "_order",
+        "_sorted_logL",
+        "_nested_samples",
+        "_ns_n",
+        "_insertion_indices",
+        "_ii_n",
+    ]:
+        state.pop(name)
+    state["live_points"] = live_points
+    state["acceptance_history"] = deque([0.5, 0.1], maxlen=ns.nlive // 10)
+    state["nested_samples"] = [p for p in live_points[:3]]
+    state["insertion_indices"] = [1, 5, 2]
+    history = {
+        "mean_acceptance_history": [0.5, 0.3],
+        "likelihood_evaluations": [10, 20],
+        "min_likelihood": [-2.0, -1.0],
+        "max_likelihood": [0.0, 1.0],
+        "logZ_history": [-5.0, -4.0],
+        "dZ_history": [3.0, 2.0],
+        "population_acceptance": [0.2],
+        "population_radii": [1.5],
+        "population_iterations": [100],
+    }
+    state.update(history)
+
+    resume_file = tmp_path / "old.pkl"
+    with patch.object(NestedSampler, "__getstate__", return_value=state):
+        with open(resume_file, "wb") as f:
+            pickle.dump(ns, f)
+
+    out = NestedSampler.resume(str(resume_file), model)
+
+    assert out.mean_acceptance == pytest.approx(0.3)
+    assert out._history_interval == max(1, ns.nlive // 10)
+    assert out.draw_batch_size == DEFAULT_DRAW_BATCH_SIZE
+    for name, values in history.items():
+        np.testing.assert_array_almost_equal(getattr(out, name), values)
+    np.testing.assert_array_equal(out.nested_samples, live_points[:3])
+    np.testing.assert_array_equal(out.insertion_indices, [1, 5, 2])
+    np.testing.assert_array_equal(out.sorted_live_points, live_points)
+    np.testing.assert_array_equal(out._sorted_logL, live_points["logL"])
+    out._add_nested_samples(live_points[3])
+    assert len(out.nested_samples) == 4
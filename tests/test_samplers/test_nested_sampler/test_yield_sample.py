@@ -2,10 +2,15 @@
 """
 Test the functions related to yielding new samples
 """
+import numpy as np
 import pytest
 from unittest.mock import MagicMock
 
-from nessai.livepoint import parameters_to_live_point
+from nessai.livepoint import (
+    numpy_array_to_live_points,
+    parameters_to_live_point,
+)
+from nessai.proposal import AnalyticProposal
 from nessai.samplers.nestedsampler import NestedSampler
 
 
@@ -22,53 +27,208 @@ def sampler(sampler, old_sample):
     sampler.proposal = MagicMock()
     sampler.logLmin = sampler.model.log_likelihood(old_sample)
     sampler.logLmax = sampler.logLmin
+    sampler.draw_batch_size = 4
     return sampler
 
 
+def make_batch(model, values, logL=0.0, logP=0.0):
+    batch = numpy_array_to_live_points(
+        np.array([[v] * len(model.names) for v in values], dtype=float),
+        names=model.names,
+    )
+    batch["logL"] = logL
+    batch["logP"] = logP
+    return batch
+
+
+def assert_samples_returned(sampler, samples):
+    """Assert the proposal was given the expected unused samples"""
+    sampler.proposal.return_samples.assert_called_once()
+    np.testing.assert_array_equal(
+        sampler.proposal.return_samples.call_args[0][0], samples
+    )
+
+
 def test_yield_sample_accept(sampler, old_sample):
     """Test function when sample is accepted"""
-    new_sample = parameters_to_live_point([1, 1], names=sampler.model.names)
-    new_sample["logL"] = 0.0
-    new_sample["logP"] = 0.0
-    sampler.proposal.draw = MagicMock(return_value=new_sample)
+    batch = make_batch(sampler.model, [1, 2])
+    sampler.proposal.draw_batch = MagicMock(return_value=batch)
 
     count, next_sample = next(NestedSampler.yield_sample(sampler, old_sample))
 
     assert count == 1
-    sampler.proposal.draw.assert_called_once_with(old_sample)
-    assert next_sample == new_sample
-    assert sampler.logLmax == sampler.model.log_likelihood(new_sample)
+    sampler.proposal.draw_batch.assert_called_once_with(old_sample, N=4)
+    assert_samples_returned(sampler, batch[1:])
+    assert next_sample == batch[0]
+    assert sampler.logLmax == sampler.model.log_likelihood(batch[0])
 
 
 def test_yield_sample_reject(sampler, old_sample):
-    """Test function when sample is rejected and a new sample is drawn"""
-    new_samples = [
-        parameters_to_live_point([6, 6], names=sampler.model.names),
-        parameters_to_live_point([1, 1], names=sampler.model.names),
-    ]
-    for s in new_samples:
-        s["logL"] = 0.0
-        s["logP"] = 0.0
+    """Test function when samples are rejected in the same batch"""
+    batch = make_batch(sampler.model, [6, 7, 1, 2])
+    sampler.proposal.draw_batch = MagicMock(return_value=batch)
+
+    count, next_sample = next(NestedSampler.yield_sample(sampler, old_sample))
+
+    assert count == 3
+    assert next_sample == batch[2]
+    assert_samples_returned(sampler, batch[3:])
+
+
+def test_yield_sample_reject_prior(sampler, old_sample):
+    """Assert samples outside the prior are skipped"""
+    batch = make_batch(sampler.model, [1, 2])
+    batch["logP"][0] = -np.inf
+    sampler.proposal.draw_batch = MagicMock(return_value=batch)
+
+    count, next_sample = next(NestedSampler.yield_sample(sampler, old_sample))
+
+    assert count == 2
+    assert next_sample == batch[1]
+    assert_samples_returned(sampler, batch[2:])
 
-    sampler.proposal.draw = MagicMock(side_effect=new_samples)
+
+def test_yield_sample_next_batch(sampler, old_sample):
+    """Test function when all samples in a batch are rejected"""
+    batches = [
+        make_batch(sampler.model, [6, 7]),
+        make_batch(sampler.model, [1]),
+    ]
+    sampler.proposal.draw_batch = MagicMock(side_effect=batches)
     sampler.proposal.populated = True
 
     count, next_sample = next(NestedSampler.yield_sample(sampler, old_sample))
 
+    assert count == 3
+    assert next_sample == batches[1][0]
+    assert sampler.proposal.draw_batch.call_count == 2
+
+
+def test_yield_sample_evaluate_likelihood(sampler, old_sample):
+    """Assert the likelihood is evaluated if it has not been"""
+    batch = make_batch(sampler.model, [6, 1], logL=0.0)
+    logL = sampler.model.log_likelihood(batch)
+    batch["logL"][0] = logL[0]
+    batch["logL"][1] = 0.0
+    sampler.proposal.draw_batch = MagicMock(return_value=batch)
+    sampler.model.evaluate_log_likelihood = MagicMock(return_value=logL[1])
+
+    count, next_sample = next(NestedSampler.yield_sample(sampler, old_sample))
+
     assert count == 2
-    assert next_sample == new_samples[1]
-    sampler.proposal.draw.assert_called_with(old_sample)
+    sampler.model.evaluate_log_likelihood.assert_called_once_with(batch[1])
+    assert next_sample["logL"] == logL[1]
 
 
 def test_yield_sample_not_populated(sampler, old_sample):
     """Test function when sample is rejected and a new sample is not drawn"""
-    new_sample = parameters_to_live_point([6, 6], names=sampler.model.names)
-
-    sampler.proposal.draw = MagicMock(return_value=new_sample)
+    batch = make_batch(sampler.model, [6])
+    sampler.proposal.draw_batch = MagicMock(return_value=batch)
     sampler.proposal.populated = False
 
     count, next_sample = next(NestedSampler.yield_sample(sampler, old_sample))
 
     assert count == 1
     assert old_sample == next_sample
-    sampler.proposal.draw.assert_called_once_with(old_sample)
+    sampler.proposal.draw_batch.assert_called_once_with(old_sample, N=4)
+    sampler.proposal.return_samples.assert_not_called()
+
+
+def test_yield_sample_pool(sampler, old_sample):
+    """Assert candidates are evaluated with the pool if it is available"""
+    batch = make_batch(sampler.model, [1, 2])
+    sampler.model.pool = MagicMock()
+    sampler._evaluate_candidates_with_pool = MagicMock(return_value=1)
+    sampler.proposal.draw_batch = MagicMock(return_value=batch)
+
+    count, next_sample = next(NestedSampler.yield_sample(sampler, old_sample))
+
+    sampler._evaluate_candidates_with_pool.assert_called_once()
+    np.testing.assert_array_equal(
+        sampler._evaluate_candidates_with_pool.call_args[0][1], [0, 1]
+    )
+    assert count == 2
+    assert next_sample == batch[1]
+    assert_samples_returned(sampler, batch[2:])
+
+
+def test_evaluate_candidates_with_pool(sampler):
+    """Assert candidates are evaluated in chunks and evaluation stops once a
+    point is accepted.
+    """
+    sampler.model.n_pool = 2
+    sampler.logLmin = 0.5
+    batch = make_batch(sampler.model, [0, 0, 0, 0, 0, 0])
+    sampler.model.batch_evaluate_log_likelihood = MagicMock(
+        side_effect=[np.array([-1.0, -2.0]), np.array([0.0, 1.0])]
+    )
+
+    accepted = NestedSampler._evaluate_candidates_with_pool(
+        sampler, batch, np.array([0, 1, 2, 3, 4])
+    )
+
+    assert accepted == 3
+    assert sampler.model.batch_evaluate_log_likelihood.call_count == 2
+    np.testing.assert_array_equal(
+        batch["logL"], [-1.0, -2.0, 0.0, 1.0, 0.0, 0.0]
+    )
+
+
+@pytest.mark.parametrize("n_pool", [None, 2])
+def test_evaluate_candidates_with_pool_none_accepted(sampler, n_pool):
+    """Assert None is returned if no candidates are accepted and points that
+    have already been evaluated are not evaluated again.
+    """
+    sampler.model.n_pool = n_pool
+    sampler.logLmin = 0.5
+    batch = make_batch(sampler.model, [0, 0, 0])
+    batch["logL"][1] = -3.0
+    sampler.model.batch_evaluate_log_likelihood = MagicMock(
+        side_effect=lambda x: -np.ones(x.size)
+    )
+
+    accepted = NestedSampler._evaluate_candidates_with_pool(
+        sampler, batch, np.array([0, 1, 2])
+    )
+
+    assert accepted is None
+    assert sampler.model.batch_evaluate_log_likelihood.call_count == 2
+    np.testing.assert_array_equal(batch["logL"], [-1.0, -3.0, -1.0])
+
+
+@pytest.mark.integration_test
+def test_yield_sample_pool_reuses_likelihood(sampler, model, old_sample):
+    """Assert likelihoods evaluated with the pool after the accepted point
+    are kept when the points are returned to the proposal and not evaluated
+    again when they are drawn.
+    """
+    proposal = AnalyticProposal(model, poolsize=8)
+    proposal.populate()
+    # Emulate a proposal that does not evaluate the likelihood of the pool
+    proposal.samples["logL"] = 0.0
+    sampler.proposal = proposal
+    sampler.draw_batch_size = 8
+    sampler.logLmin = -np.inf
+    sampler._evaluate_candidates_with_pool = (
+        lambda *args: NestedSampler._evaluate_candidates_with_pool(
+            sampler, *args
+        )
+    )
+    model.pool = MagicMock()
+    model.n_pool = 4
+    model.likelihood_evaluations = 0
+
+    def batch_evaluate_log_likelihood(x):
+        model.likelihood_evaluations += x.size
+        return model.log_likelihood(x)
+
+    model.batch_evaluate_log_likelihood = batch_evaluate_log_likelihood
+
+    samples = NestedSampler.yield_sample(sampler, old_sample)
+    _, first = next(samples)
+    assert model.likelihood_evaluations == 4
+    _, second = next(samples)
+    # Only the fourth point in the second batch has not been evaluated
+    assert model.likelihood_evaluations == 5
+    assert second["logL"] == model.log_likelihood(second)
+    assert len(proposal.indices) == 6
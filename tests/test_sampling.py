@@ -177,9 +177,9 @@ def test_sampling_with_n_pool(model, flow_config, tmpdir, mp_context):
     Test running the sampler with multiprocessing.
     """
     output = str(tmpdir.mkdir("pool"))
-    with patch("multiprocessing.Pool", mp_context.Pool), patch(
-        "nessai.utils.multiprocessing.multiprocessing.get_start_method",
-        mp_context.get_start_method,
+    with patch(
+        "nessai.utils.multiprocessing.get_multiprocessing_context",
+        return_value=mp_context,
     ):
         fp = FlowSampler(
             model,
@@ -249,9 +249,9 @@ def test_sampling_resume_w_pool(model, flow_config, tmpdir, mp_context):
     Test resuming the sampler with a pool.
     """
     output = str(tmpdir.mkdir("resume"))
-    with patch("multiprocessing.Pool", mp_context.Pool), patch(
-        "nessai.utils.multiprocessing.multiprocessing.get_start_method",
-        mp_context.get_start_method,
+    with patch(
+        "nessai.utils.multiprocessing.get_multiprocessing_context",
+        return_value=mp_context,
     ):
         fp = FlowSampler(
             model,
@@ -276,9 +276,9 @@ def test_sampling_resume_w_pool(model, flow_config, tmpdir, mp_context):
     # Make sure the pool is already closed
     model.close_pool()
 
-    with patch("multiprocessing.Pool", mp_context.Pool), patch(
-        "nessai.utils.multiprocessing.multiprocessing.get_start_method",
-        mp_context.get_start_method,
+    with patch(
+        "nessai.utils.multiprocessing.get_multiprocessing_context",
+        return_value=mp_context,
     ):
         fp = FlowSampler(
             model,
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the checkpointing utilities.
+"""
+import io
+import pickle
+
+import numpy as np
+
+from nessai.livepoint import numpy_array_to_live_points
+from nessai.utils import checkpointing
+from nessai.utils.testing import assert_structured_arrays_equal
+
+
+class Dummy:
+    _checkpoint_arrays = ("x", "y", "z", "missing")
+
+    def __init__(self):
+        self.x = np.arange(10.0)
+        self.y = numpy_array_to_live_points(np.random.rand(5, 2), ["a", "b"])
+        self.z = np.array([None, 1], dtype=object)
+        self.w = [1, 2, 3]
+
+    def __getstate__(self):
+        return self.__dict__.copy()
+
+
+class DummyNoGetState:
+    _checkpoint_arrays = ("x",)
+
+    def __init__(self):
+        self.x = np.arange(4.0)
+        self.w = "a"
+
+
+class DummySetState(Dummy):
+    def __setstate__(self, state):
+        state["restored"] = True
+        self.__dict__.update(state)
+
+
+def round_trip(obj):
+    f = io.BytesIO()
+    checkpointing.dump(obj, f)
+    f.seek(0)
+    return checkpointing.load(f)
+
+
+def test_dump_load():
+    """Assert arrays are restored after being written separately"""
+    obj = Dummy()
+    out = round_trip(obj)
+    assert type(out) is Dummy
+    np.testing.assert_array_equal(out.x, obj.x)
+    assert_structured_arrays_equal(out.y, obj.y)
+    np.testing.assert_array_equal(out.z, obj.z)
+    assert out.w == obj.w
+
+
+def test_dump_arrays_not_pickled():
+    """Assert the numeric arrays are not included in the pickled state"""
+    obj = Dummy()
+    f = io.BytesIO()
+    checkpointing.dump(obj, f)
+    f.seek(0)
+    _, state, names = pickle.load(f)
+    assert names == ["x", "y"]
+    assert "x" not in state
+    assert "y" not in state
+    assert "z" in state
+
+
+def test_load_setstate():
+    """Assert __setstate__ is used if it is defined"""
+    out = round_trip(DummySetState())
+    assert out.restored is True
+
+
+def test_dump_load_no_getstate():
+    """Assert objects without a custom __getstate__ can be written and are
+    not modified when written.
+    """
+    obj = DummyNoGetState()
+    out = round_trip(obj)
+    np.testing.assert_array_equal(out.x, obj.x)
+    assert out.w == "a"
+    assert set(obj.__dict__) == {"x", "w"}
+
+
+def test_load_pickle():
+    """Assert files containing a single pickled object can be loaded"""
+    f = io.BytesIO()
+    pickle.dump({"a": 1}, f)
+    f.seek(0)
+    assert checkpointing.load(f) == {"a": 1}
+
+
+def test_dump_protocol():
+    """Assert the state is pickled with the highest protocol"""
+    f = io.BytesIO()
+    checkpointing.dump(Dummy(), f)
+    data = f.getvalue()
+    assert data[0] == pickle.PROTO[0]
+    assert data[1] == pickle.HIGHEST_PROTOCOL
@@ -4,11 +4,14 @@ Tests for rescaling functions
 """
 import multiprocessing
 from multiprocessing.dummy import Pool
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
 from nessai.utils.multiprocessing import (
+    batch_log_likelihood_wrapper,
     check_multiprocessing_start_method,
+    get_multiprocessing_context,
     initialise_pool_variables,
     get_n_pool,
     log_likelihood_wrapper,
@@ -30,6 +33,20 @@ def test_pool_variables():
     initialise_pool_variables(None)
 
 
+def test_batch_log_likelihood_wrapper():
+    """Assert the likelihood is evaluated for each sample in a chunk"""
+    model = MagicMock()
+    model.log_likelihood = lambda x: 2 * x
+    initialise_pool_variables(model)
+    pool = Pool(1)
+    out = pool.map(batch_log_likelihood_wrapper, [np.arange(3), np.arange(2)])
+    pool.close()
+    pool.terminate()
+    np.testing.assert_array_equal(out[0], [0.0, 2.0, 4.0])
+    np.testing.assert_array_equal(out[1], [0.0, 2.0])
+    initialise_pool_variables(None)
+
+
 def test_check_multiprocessing_start_method():
     """Test check multiprocessing start method passes for 'fork'"""
     with patch("multiprocessing.get_start_method", return_value="fork"):
@@ -66,6 +83,64 @@ def test_check_multiprocessing_start_method_error_integration():
         check_multiprocessing_start_method()
 
 
+def test_get_multiprocessing_context():
+    """Assert the fork context is returned if the start method is not set"""
+    context = MagicMock()
+    with patch(
+        "multiprocessing.get_start_method", return_value=None
+    ) as mock_start, patch(
+        "multiprocessing.get_context", return_value=context
+    ) as mock_get:
+        out = get_multiprocessing_context()
+    mock_start.assert_called_once_with(allow_none=True)
+    mock_get.assert_called_once_with("fork")
+    assert out is context
+
+
+def test_get_multiprocessing_context_start_method_set():
+    """Assert the default context is returned if the start method is set"""
+    context = MagicMock()
+    with patch("multiprocessing.get_start_method", return_value="fork"), patch(
+        "nessai.utils.multiprocessing.check_multiprocessing_start_method"
+    ) as mock_check, patch(
+        "multiprocessing.get_context", return_value=context
+    ) as mock_get:
+        out = get_multiprocessing_context()
+    mock_check.assert_called_once()
+    mock_get.assert_called_once_with()
+    assert out is context
+
+
+@pytest.mark.parametrize("method", ["spawn", "forkserver"])
+def test_get_multiprocessing_context_start_method_error(method):
+    """Assert an error is raised if the start method is set to a method
+    other than fork.
+    """
+    error_msg = r"nessai only supports multiprocessing using the 'fork' .*"
+    with patch(
+        "multiprocessing.get_start_method", return_value=method
+    ), pytest.raises(RuntimeError, match=error_msg):
+        get_multiprocessing_context()
+
+
+def test_get_multiprocessing_context_error():
+    """Assert an error is raised if fork is not available"""
+    error_msg = r"nessai only supports multiprocessing using the 'fork' .*"
+    with patch("multiprocessing.get_start_method", return_value=None), patch(
+        "multiprocessing.get_context", side_effect=ValueError
+    ), pytest.raises(RuntimeError, match=error_msg):
+        get_multiprocessing_context()
+
+
+@pytest.mark.integration_test
+@pytest.mark.skip_on_windows
+def test_get_multiprocessing_context_integration():
+    """Assert the fork context is used if the start method is not set"""
+    with patch("multiprocessing.get_start_method", return_value=None):
+        context = get_multiprocessing_context()
+    assert context.get_start_method() == "fork"
+
+
 def test_model_error():
     """Assert an error is raised in the global variables have not been \
         initialised
@@ -3,6 +3,7 @@
 Tests for the stats related utilities.
 """
 import numpy as np
+from scipy.special import logsumexp
 
 from nessai.utils.stats import effective_sample_size, rolling_mean
 
@@ -15,6 +16,16 @@ def test_ess():
     assert (log_w == 0.0).all()
 
 
+def test_ess_matches_logsumexp():
+    """Assert the effective sample size matches the definition using the
+    normalised weights.
+    """
+    log_w = np.random.randn(1000) - 1000.0
+    log_w_norm = log_w - logsumexp(log_w)
+    expected = np.exp(-logsumexp(2 * log_w_norm))
+    np.testing.assert_allclose(effective_sample_size(log_w), expected)
+
+
 def test_rolling_mean():
     """Test the rolling mean."""
     x = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
@@ -2,10 +2,14 @@
 """
 Tests for utilities related to python structures such as lists.
 """
+import pickle
+
 import numpy as np
 import pytest
 
 from nessai.utils.structures import (
+    AppendableArray,
+    RingBuffer,
     array_split_chunksize,
     get_subset_arrays,
     isfinite_struct,
@@ -135,3 +139,63 @@ def test_array_split_chunksize_invalid_chunksize():
     """Assert an error is returned if the chunksize is less than one"""
     with pytest.raises(ValueError, match="chunksize must be greater than 1"):
         array_split_chunksize(np.array([1, 2]), -1)
+
+
+def test_ring_buffer():
+    """Assert the ring buffer keeps the most recent values and their mean"""
+    buffer = RingBuffer(3)
+    assert len(buffer) == 0
+    assert np.isnan(buffer.mean)
+    for v in [1.0, 2.0]:
+        buffer.append(v)
+    assert len(buffer) == 2
+    assert buffer.mean == 1.5
+    np.testing.assert_array_equal(np.asarray(buffer), [1.0, 2.0])
+    for v in [3.0, 4.0, 5.0, 6.0]:
+        buffer.append(v)
+    assert len(buffer) == 3
+    assert buffer.mean == 5.0
+    np.testing.assert_array_equal(np.asarray(buffer), [4.0, 5.0, 6.0])
+    buffer.append(7.0)
+    np.testing.assert_array_equal(np.asarray(buffer), [5.0, 6.0, 7.0])
+
+
+def test_ring_buffer_zero_size():
+    """Assert a buffer with size zero never stores any values"""
+    buffer = RingBuffer(0)
+    buffer.append(1.0)
+    assert len(buffer) == 0
+    assert np.isnan(buffer.mean)
+
+
+def test_ring_buffer_mean_matches_numpy():
+    """Assert the running mean matches the mean of the latest values"""
+    x = np.random.rand(1000)
+    buffer = RingBuffer(37)
+    for v in x:
+        buffer.append(v)
+    np.testing.assert_allclose(buffer.mean, x[-37:].mean())
+
+
+@pytest.mark.parametrize("dtype", [float, np.float32, int])
+def test_appendable_array(dtype):
+    """Assert values are stored with the dtype and the array grows"""
+    array = AppendableArray(dtype=dtype, capacity=2)
+    assert len(array) == 0
+    for v in range(5):
+        array.append(v)
+    assert len(array) == 5
+    assert array.dtype == dtype
+    assert array[-1] == 4
+    np.testing.assert_array_equal(np.asarray(array), np.arange(5))
+    assert np.asarray(array).dtype == dtype
+
+
+def test_appendable_array_pickle():
+    """Assert only the values are pickled and appending still works"""
+    array = AppendableArray(capacity=100)
+    pickled = pickle.loads(pickle.dumps(array))
+    assert pickled._data.size == 0
+    pickled.append(1.0)
+    pickled.append(2.0)
+    np.testing.assert_array_equal(pickled.values, [1.0, 2.0])
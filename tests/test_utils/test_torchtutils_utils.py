@@ -2,12 +2,13 @@
 """
 Tests for torch utils.
 """
+import inspect
 from unittest.mock import patch
 
 import pytest
 import torch
 
-from nessai.utils.torchutils import set_torch_default_dtype
+from nessai.utils.torchutils import load_state_dict, set_torch_default_dtype
 
 
 @pytest.mark.parametrize(
@@ -40,3 +41,29 @@ def test_setting_default_dtype_invalid_input():
     with pytest.raises(ValueError) as excinfo:
         set_torch_default_dtype("not_a_dtype")
     assert "Unknown torch dtype: not_a_dtype" in str(excinfo.value)
+
+
+def test_load_state_dict(tmp_path):
+    """Assert a state dictionary can be saved and loaded"""
+    model = torch.nn.Linear(2, 2)
+    filename = tmp_path / "weights.pt"
+    torch.save(model.state_dict(), filename)
+    out = load_state_dict(filename)
+    assert out.keys() == model.state_dict().keys()
+    for key, value in model.state_dict().items():
+        assert torch.equal(out[key], value)
+        assert out[key].device == torch.device("cpu")
+
+
+def test_load_state_dict_kwargs():
+    """Assert only supported keyword arguments are passed to torch.load"""
+
+    def load(f, map_location=None):
+        pass
+
+    with patch("torch.load", side_effect=load) as mock_load, patch(
+        "nessai.utils.torchutils.inspect.signature",
+        return_value=inspect.signature(load),
+    ):
+        load_state_dict("weights.pt")
+    mock_load.assert_called_once_with("weights.pt", map_location="cpu")